@@ -19,4 +19,4 @@ persistor = WeaviatePersistor(
 )
 persistor.create_collection({})
 
-client_factory._client.close()
+client_factory.close()
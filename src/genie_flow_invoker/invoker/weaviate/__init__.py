@@ -1,14 +1,13 @@
 import json
 from abc import ABC, abstractmethod
-from hashlib import md5
-from typing import Any, Iterable, Sized
+from hashlib import blake2b
+from typing import Any, Optional
 
 from genie_flow_invoker.genie import GenieInvoker
 from loguru import logger
-from pydantic_core._pydantic_core import ValidationError
-from pydantic.json import pydantic_encoder
+from pydantic import TypeAdapter, ValidationError
 
-from .client import WeaviateClientFactory
+from .client import AsyncWeaviateClientFactory, WeaviateClientFactory
 from .delete import WeaviateDeleter
 from .exceptions import (
     CollectionNotFoundException,
@@ -28,7 +27,26 @@ from .model import (
     WeaviateSimilaritySearchRequest,
 )
 from .persist import WeaviatePersistor
-from .search import AbstractSearcher, SimilaritySearcher, VectorSimilaritySearcher, ChunkedDocumentListModel
+from .search import (
+    AbstractSearcher,
+    ChunkedDocumentBatchModel,
+    ChunkedDocumentListModel,
+    SimilaritySearcher,
+    VectorSimilaritySearcher,
+)
+
+
+QueryVectorModel = TypeAdapter(list[float])
+QueryTextsModel = TypeAdapter(list[str])
+
+# bind the core validator and serializer of search requests once, skipping the model wrappers
+_validate_search_request = WeaviateSimilaritySearchRequest.__pydantic_validator__.validate_json
+_dump_search_request = WeaviateSimilaritySearchRequest.__pydantic_serializer__.to_python
+
+
+def _content_hash(content: str) -> str:
+    # a short fingerprint, only used to correlate log lines
+    return blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
 
 
 class AbstractWeaviateInvoker(GenieInvoker, ABC):
@@ -41,6 +59,11 @@ class AbstractWeaviateInvoker(GenieInvoker, ABC):
         connection_config = config["connection"]
         return WeaviateClientFactory(connection_config)
 
+    @classmethod
+    def create_async_client_factory(cls, config: dict):
+        connection_config = config["connection"]
+        return AsyncWeaviateClientFactory(connection_config)
+
 
 class ConfiguredWeaviateSimilaritySearchInvoker(AbstractWeaviateInvoker, ABC):
 
@@ -48,6 +71,7 @@ class ConfiguredWeaviateSimilaritySearchInvoker(AbstractWeaviateInvoker, ABC):
         self,
         client_factory: WeaviateClientFactory,
         query_config: dict[str, Any],
+        async_client_factory: Optional[AsyncWeaviateClientFactory] = None,
     ) -> None:
         super().__init__(client_factory)
         """
@@ -55,10 +79,18 @@ class ConfiguredWeaviateSimilaritySearchInvoker(AbstractWeaviateInvoker, ABC):
 
         This is the basic Weaviate similarity search invoker that reads search parameters` from
         the `meta.yaml` file that is used to create this invoker.
+
+        Invokers are reentrant: one instance can serve concurrent invocations from multiple
+        threads, as the state of a search is local to that search.
         """
         self.client_factory = client_factory
+        self.async_client_factory = async_client_factory
         self.query_config = query_config
-        self.searcher = self.searcher_class(self.client_factory, self.query_config)
+        self.searcher = self.searcher_class(
+            self.client_factory,
+            self.query_config,
+            self.async_client_factory,
+        )
 
     @classmethod
     def from_config(cls, config: dict):
@@ -68,8 +100,9 @@ class ConfiguredWeaviateSimilaritySearchInvoker(AbstractWeaviateInvoker, ABC):
         Should also include the key `query` for all (default) query parameters.
         """
         client_factory = cls.create_client_factory(config)
+        async_client_factory = cls.create_async_client_factory(config)
         query_config = config["query"]
-        return cls(client_factory, query_config)
+        return cls(client_factory, query_config, async_client_factory)
 
     @property
     @abstractmethod
@@ -91,14 +124,31 @@ class ConfiguredWeaviateSimilaritySearchInvoker(AbstractWeaviateInvoker, ABC):
         :return: a list of `ChunkDistance` objects
         """
         logger.debug("invoking weaviate with '{content}'", content=content)
-        logger.info(
+        logger.opt(lazy=True).info(
             "invoking similarity search for content hash {content_hash}",
-            content_hash=md5(content.encode("utf-8")).hexdigest(),
+            content_hash=lambda: _content_hash(content),
         )
         search_params = self._parse_input(content)
         results = self.searcher.search(**search_params)
         return ChunkedDocumentListModel.dump_json(results).decode("utf-8")
 
+    async def ainvoke(self, content: str) -> str:
+        """
+        Execute the similarity search asynchronously, using the asynchronous Weaviate
+        client. Content is parsed in the same way as for `invoke`.
+
+        :param content: the content to be processed
+        :return: a list of `ChunkedDocument` objects
+        """
+        logger.debug("invoking weaviate asynchronously with '{content}'", content=content)
+        logger.opt(lazy=True).info(
+            "invoking asynchronous similarity search for content hash {content_hash}",
+            content_hash=lambda: _content_hash(content),
+        )
+        search_params = self._parse_input(content)
+        results = await self.searcher.asearch(**search_params)
+        return ChunkedDocumentListModel.dump_json(results).decode("utf-8")
+
 
 class WeaviateSimilaritySearchInvoker(ConfiguredWeaviateSimilaritySearchInvoker):
     """
@@ -115,11 +165,60 @@ class WeaviateSimilaritySearchInvoker(ConfiguredWeaviateSimilaritySearchInvoker)
             "invoking similarity search for content {content}",
             content=content,
         )
+        return dict(query_text=content)
+
+
+class WeaviateBatchSimilaritySearchInvoker(ConfiguredWeaviateSimilaritySearchInvoker):
+    """
+    This Invoker conducts a similarity search for each of a list of texts. The list is
+    expected to be passed as a JSON encoded list of strings. The searches are conducted
+    concurrently. Will return a JSON version of a list that contains, for each of the texts,
+    a list of `ChunkedDocument` objects.
+    """
+
+    @property
+    def searcher_class(self) -> type[AbstractSearcher]:
+        return SimilaritySearcher
+
+    def _parse_input(self, content: str) -> dict[str, Any]:
+        try:
+            query_texts = QueryTextsModel.validate_json(content)
+        except ValidationError:
+            logger.error("invalid content '{content}'", content=content)
+            raise ValueError("expected a JSON encoded list of strings")
         logger.info(
-            "invoking similarity search for content hash {content_hash}",
-            content_hash=md5(content.encode("utf-8")).hexdigest(),
+            "invoking similarity search for a batch of {nr_texts} texts",
+            nr_texts=len(query_texts),
         )
-        return dict(query_text=content)
+        return dict(queries=query_texts)
+
+    def invoke(self, content: str) -> str:
+        """
+        Execute the similarity searches for a batch of texts.
+
+        Output is a JSON dump of a list, containing for each text a list of
+        `ChunkedDocument` objects.
+
+        :param content: a JSON encoded list of strings
+        :return: a JSON encoded list of lists of `ChunkedDocument` objects
+        """
+        logger.debug("invoking weaviate with '{content}'", content=content)
+        search_params = self._parse_input(content)
+        results = self.searcher.search_batch(**search_params)
+        return ChunkedDocumentBatchModel.dump_json(results).decode("utf-8")
+
+    async def ainvoke(self, content: str) -> str:
+        """
+        Execute the similarity searches for a batch of texts asynchronously, gathering
+        the searches on the event loop.
+
+        :param content: a JSON encoded list of strings
+        :return: a JSON encoded list of lists of `ChunkedDocument` objects
+        """
+        logger.debug("invoking weaviate asynchronously with '{content}'", content=content)
+        search_params = self._parse_input(content)
+        results = await self.searcher.asearch_batch(**search_params)
+        return ChunkedDocumentBatchModel.dump_json(results).decode("utf-8")
 
 
 class WeaviateVectorSimilaritySearchInvoker(ConfiguredWeaviateSimilaritySearchInvoker):
@@ -134,13 +233,10 @@ class WeaviateVectorSimilaritySearchInvoker(ConfiguredWeaviateSimilaritySearchIn
 
     def _parse_input(self, content: str) -> dict[str, Any]:
         try:
-            query_vector = json.loads(content)
-        except json.decoder.JSONDecodeError:
+            query_vector = QueryVectorModel.validate_json(content)
+        except ValidationError:
             logger.error("invalid content '{content}'", content=content)
             raise ValueError("expected a JSON encoded list of floats")
-        if not isinstance(query_vector, list):
-            logger.error("invalid type of query vector '{content}'", content=content)
-            raise ValueError("expected a JSON encoded list of floats")
         logger.debug(
             "invoking similarity search for vector of {nr_dims} dimensions, "
             "starting with {first_values}",
@@ -151,7 +247,7 @@ class WeaviateVectorSimilaritySearchInvoker(ConfiguredWeaviateSimilaritySearchIn
             "invoking similarity search for vector of {nr_dims} dimensions",
             nr_dims=len(query_vector),
         )
-        return dict(query_vector=query_vector)
+        return dict(query_embedding=query_vector)
 
 
 class WeaviateSimilaritySearchRequestInvoker(ConfiguredWeaviateSimilaritySearchInvoker):
@@ -165,36 +261,45 @@ class WeaviateSimilaritySearchRequestInvoker(ConfiguredWeaviateSimilaritySearchI
 
     def _parse_input(self, content: str) -> dict[str, Any]:
         try:
-            query_params = WeaviateSimilaritySearchRequest.model_validate_json(content)
+            query_params = _validate_search_request(content)
         except ValidationError as e:
             logger.error("could not parse invalid content '{content}'", content=content)
             raise ValueError("invalid content '{content}'".format(content=content))
-        logger.debug(
+        search_params = _dump_search_request(query_params)
+        logger.opt(lazy=True).debug(
             "invoking similarity search using parameters: {json_query_params}",
-            json_query_params=query_params.model_dump_json(),
-            **query_params.model_dump(),
+            json_query_params=query_params.model_dump_json,
         )
         logger.info(
             "invoking similarity search using parameters: {params}",
-            params=query_params.model_dump().keys(),
+            params=search_params.keys(),
         )
-        return query_params.model_dump()
+        return search_params
 
 
 class AbstractWeaviatePersistorInvoker(AbstractWeaviateInvoker, ABC):
 
     def __init__(
-        self, client_factory: WeaviateClientFactory, persist_config: dict
+        self,
+        client_factory: WeaviateClientFactory,
+        persist_config: dict,
+        async_client_factory: Optional[AsyncWeaviateClientFactory] = None,
     ) -> None:
         super().__init__(client_factory)
         self.persist_config = persist_config
-        self.persistor = WeaviatePersistor(self.client_factory, self.persist_config)
+        self.async_client_factory = async_client_factory
+        self.persistor = WeaviatePersistor(
+            self.client_factory,
+            self.persist_config,
+            self.async_client_factory,
+        )
 
     @classmethod
     def from_config(cls, config: dict):
         client_factory = cls.create_client_factory(config)
+        async_client_factory = cls.create_async_client_factory(config)
         persist_config = config["persist"]
-        return cls(client_factory, persist_config)
+        return cls(client_factory, persist_config, async_client_factory)
 
 
 class WeaviateCreateTenantInvoker(AbstractWeaviatePersistorInvoker):
@@ -244,9 +349,10 @@ class WeaviatePersistInvoker(AbstractWeaviatePersistorInvoker):
     and returns a JSON dump of a `WeaviateSimilaritySearchResponse`.
     """
 
-    def invoke(self, content: str) -> str:
+    @staticmethod
+    def _parse_request(content: str) -> WeaviatePersistenceRequest:
         try:
-            request = WeaviatePersistenceRequest.model_validate_json(content)
+            return WeaviatePersistenceRequest.model_validate_json(content)
         except ValidationError as e:
             logger.error(
                 "Cannot parse content as persistence request '{content}', error: {error}",
@@ -255,6 +361,8 @@ class WeaviatePersistInvoker(AbstractWeaviatePersistorInvoker):
             )
             raise ValueError("invalid content '{content}'")
 
+    def invoke(self, content: str) -> str:
+        request = self._parse_request(content)
         collection_name, tenant_name, nr_inserted, nr_replaced = (
             self.persistor.persist_document(
                 document=request.document,
@@ -271,6 +379,31 @@ class WeaviatePersistInvoker(AbstractWeaviatePersistorInvoker):
             nr_replaces=nr_replaced,
         ).model_dump_json()
 
+    async def ainvoke(self, content: str) -> str:
+        """
+        Persist the document asynchronously, using the asynchronous Weaviate client. The
+        batches of chunks at the same hierarchy level are inserted concurrently.
+
+        :param content: a JSON dump of a `WeaviatePersistenceRequest`
+        :return: a JSON dump of a `WeaviatePersistenceResponse`
+        """
+        request = self._parse_request(content)
+        collection_name, tenant_name, nr_inserted, nr_replaced = (
+            await self.persistor.apersist_document(
+                document=request.document,
+                collection_name=request.collection_name,
+                tenant_name=request.tenant_name,
+                batch_size=request.batch_size,
+            )
+        )
+
+        return WeaviatePersistenceResponse(
+            collection_name=collection_name,
+            tenant_name=tenant_name,
+            nr_inserts=nr_inserted,
+            nr_replaces=nr_replaced,
+        ).model_dump_json()
+
 
 class AbstractWeaviateDeleteInvoker(AbstractWeaviateInvoker, ABC):
 
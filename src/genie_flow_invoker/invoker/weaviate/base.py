@@ -1,9 +1,12 @@
 from typing import Any, NamedTuple, Optional, overload
 
-from genie_flow_invoker.invoker.weaviate import WeaviateClientFactory
+from genie_flow_invoker.invoker.weaviate import (
+    AsyncWeaviateClientFactory,
+    WeaviateClientFactory,
+)
 from genie_flow_invoker.invoker.weaviate.exceptions import NoCollectionProvided
 from loguru import logger
-from weaviate.collections import Collection
+from weaviate.collections import Collection, CollectionAsync
 
 
 class CollectionTenant(NamedTuple):
@@ -17,8 +20,10 @@ class WeaviateClientProcessor:
         self,
         client_factory: WeaviateClientFactory,
         processor_params: dict[str, Any],
+        async_client_factory: Optional[AsyncWeaviateClientFactory] = None,
     ):
         self.client_factory = client_factory
+        self.async_client_factory = async_client_factory
         self.base_params = CollectionTenant(
             collection_name=processor_params.get("collection_name", None),
             tenant_name=processor_params.get("tenant_name", None),
@@ -103,3 +108,37 @@ class WeaviateClientProcessor:
             raise KeyError(f"Tenant {tenant_name} does not exist in collection {collection.name}")
 
         return collection.with_tenant(tenant_name)
+
+    async def aget_collection_or_tenant(
+        self,
+        collection_name: Optional[str] = None,
+        tenant_name: Optional[str] = None,
+    ) -> CollectionAsync:
+        """
+        The asynchronous counterpart of `get_collection_or_tenant`, retrieving the collection,
+        or tenant within that collection, using the async client factory.
+        """
+        if self.async_client_factory is None:
+            logger.error("No async client factory configured")
+            raise ValueError("Cannot connect asynchronously without an async client factory")
+
+        collection_name, tenant_name = self.compile_collection_tenant_names(
+            collection_name, tenant_name
+        )
+        async with self.async_client_factory as client:
+            if not await client.collections.exists(collection_name):
+                raise KeyError(f"Collection {collection_name} does not exist")
+            collection = client.collections.get(collection_name)
+
+        if tenant_name is None:
+            return collection
+
+        if not await collection.tenants.exists(tenant_name):
+            logger.error(
+                "Tenant {tenant_name} does not exist in collection {collection_name}",
+                tenant_name=tenant_name,
+                collection_name=collection_name,
+            )
+            raise KeyError(f"Tenant {tenant_name} does not exist in collection {collection_name}")
+
+        return collection.with_tenant(tenant_name)
@@ -1,27 +1,33 @@
+import asyncio
+import itertools
+import threading
 from typing import Any, Optional
 
 from genie_flow_invoker.utils import get_config_value
 from loguru import logger
 
 import weaviate
-from weaviate import WeaviateClient
-from weaviate.classes.init import Auth
+from weaviate import WeaviateAsyncClient, WeaviateClient
+from weaviate.classes.init import AdditionalConfig, Auth, Timeout
+from weaviate.config import ConnectionConfig
+from weaviate.exceptions import (
+    WeaviateClosedClientError,
+    WeaviateConnectionError,
+    WeaviateGRPCUnavailableError,
+)
 
+# the errors that indicate that a client has lost its connection to Weaviate
+CONNECTION_ERRORS = (
+    WeaviateClosedClientError,
+    WeaviateConnectionError,
+    WeaviateGRPCUnavailableError,
+)
 
-class WeaviateClientFactory:
-    """
-    A factory to create Weaviate clients. Maintains a singleton but when that singleton
-    is not live, will create a new one.
-
-    Configuration is set at initiation of the factory, and then used for the Weaviate client.
-
-    This factory works like a context manager, so can be used as follows:
-
-    ```
-    with WeaviateClientFactory() as client:
-        client.collections. ...
-    ```
 
+class AbstractWeaviateClientFactory:
+    """
+    The base of the Weaviate client factories. Reads the connection configuration and
+    compiles the parameters that are used to connect to Weaviate.
     """
 
     def __init__(self, config: dict[str, Any]):
@@ -34,9 +40,16 @@ class WeaviateClientFactory:
         `WEAVIATE_HTTP_HOST`, `WEAVIATE_HTTP_PORT`, `WEAVIATE_HTTP_SECURE`,
         `WEAVIATE_GRPC_HOST`, `WEAVIATE_GRPC_PORT`, `WEAVIATE_GRPC_SECURE` and
         `WEAVIATE_API_KEY`.
-        """
-        self._client: Optional[WeaviateClient] = None
 
+        Optionally, the timeouts (in seconds) can be configured through `timeout_init`,
+        `timeout_query` and `timeout_insert`, overridden by `WEAVIATE_TIMEOUT_INIT`,
+        `WEAVIATE_TIMEOUT_QUERY` and `WEAVIATE_TIMEOUT_INSERT`. They default to 2, 30 and 90
+        seconds respectively.
+
+        The HTTP connection pool of a client can be sized through `session_pool_connections`
+        and `session_pool_maxsize`, overridden by `WEAVIATE_SESSION_POOL_CONNECTIONS` and
+        `WEAVIATE_SESSION_POOL_MAXSIZE`. They default to 20 and 100 respectively.
+        """
         self.http_host = get_config_value(
             config,
             "WEAVIATE_HTTP_HOST",
@@ -80,32 +93,284 @@ class WeaviateClientFactory:
             "Weaviate API Key",
             None,
         )
+        self.timeout = Timeout(
+            init=float(
+                get_config_value(
+                    config,
+                    "WEAVIATE_TIMEOUT_INIT",
+                    "timeout_init",
+                    "Timeout for initialising a connection",
+                    2,
+                )
+            ),
+            query=float(
+                get_config_value(
+                    config,
+                    "WEAVIATE_TIMEOUT_QUERY",
+                    "timeout_query",
+                    "Timeout for queries",
+                    30,
+                )
+            ),
+            insert=float(
+                get_config_value(
+                    config,
+                    "WEAVIATE_TIMEOUT_INSERT",
+                    "timeout_insert",
+                    "Timeout for inserts",
+                    90,
+                )
+            ),
+        )
+
+        self.connection = ConnectionConfig(
+            session_pool_connections=int(
+                get_config_value(
+                    config,
+                    "WEAVIATE_SESSION_POOL_CONNECTIONS",
+                    "session_pool_connections",
+                    "Number of connection pools to cache",
+                    20,
+                )
+            ),
+            session_pool_maxsize=int(
+                get_config_value(
+                    config,
+                    "WEAVIATE_SESSION_POOL_MAXSIZE",
+                    "session_pool_maxsize",
+                    "Maximum number of connections in a pool",
+                    100,
+                )
+            ),
+        )
+
+    def _connection_params(self) -> dict[str, Any]:
+        connection_params = {
+            "http_host":     self.http_host,
+            "http_port":     self.http_port,
+            "http_secure":   self.http_secure,
+            "grpc_host":     self.grpc_host,
+            "grpc_port":     self.grpc_port,
+            "grpc_secure":   self.grpc_secure,
+            "additional_config": AdditionalConfig(
+                timeout=self.timeout,
+                connection=self.connection,
+            ),
+        }
+
+        if self.api_key:
+            # If weaviate_api_key is not None or an empty string, add authentication
+            connection_params["auth_credentials"] = Auth.api_key(self.api_key)
+            logger.info(
+                "Connecting with API Key authentication with key of length {key_length}",
+                key_length=len(self.api_key),
+            )
+        return connection_params
+
+
+class WeaviateClientFactory(AbstractWeaviateClientFactory):
+    """
+    A factory to create Weaviate clients. Maintains a small pool of clients, and when a
+    client in that pool is not connected, will replace it with a new one. Handing out a client
+    does not make a request to Weaviate; instead, a client that fails to reach Weaviate is
+    discarded, so that a new one is connected the next time. Every thread is assigned one of
+    the clients in the pool, in a round-robin fashion, so that concurrent calls are spread
+    over multiple connections.
+
+    Configuration is set at initiation of the factory, and then used for the Weaviate client.
+
+    This factory works like a context manager, so can be used as follows:
+
+    ```
+    with WeaviateClientFactory() as client:
+        client.collections. ...
+    ```
+
+    """
+
+    def __init__(self, config: dict[str, Any]):
+        """
+        Creates a new Weaviate client factory. On top of the connection configuration, the
+        config can contain `pool_size`, the number of clients to maintain. Defaults to 4 and
+        can be overridden by the environment variable `WEAVIATE_POOL_SIZE`.
+
+        The config can also contain `batch_size`, the number of objects that are sent to
+        Weaviate in a single batch when persisting. Defaults to 1000 and can be overridden
+        by the environment variable `WEAVIATE_BATCH_SIZE`.
+        """
+        super().__init__(config)
+        self.pool_size = int(
+            get_config_value(
+                config,
+                "WEAVIATE_POOL_SIZE",
+                "pool_size",
+                "Client pool size",
+                4,
+            )
+        )
+        self.batch_size = int(
+            get_config_value(
+                config,
+                "WEAVIATE_BATCH_SIZE",
+                "batch_size",
+                "Batch size for persisting",
+                1000,
+            )
+        )
+        if self.batch_size < 1:
+            logger.error(
+                "Batch size should be positive, not {batch_size}",
+                batch_size=self.batch_size,
+            )
+            raise ValueError(f"Batch size should be positive, not {self.batch_size}")
+        self._pool: list[Optional[WeaviateClient]] = [None] * self.pool_size
+        self._pool_locks = [threading.Lock() for _ in range(self.pool_size)]
+        self._pool_index = itertools.count()
+        self._thread_local = threading.local()
+
+    def _thread_slot(self) -> int:
+        try:
+            return self._thread_local.slot
+        except AttributeError:
+            self._thread_local.slot = next(self._pool_index) % self.pool_size
+            return self._thread_local.slot
 
     def __enter__(self):
-        if self._client is None or not self._client.is_live():
-            logger.info("No live weaviate client, creating a new one")
-            if self._client is not None:
-                self._client.close()
-            
-            connection_params = {
-                "http_host":     self.http_host,
-                "http_port":     self.http_port,
-                "http_secure":   self.http_secure,
-                "grpc_host":     self.grpc_host,
-                "grpc_port":     self.grpc_port,
-                "grpc_secure":   self.grpc_secure,
-            }
-
-            if self.api_key:
-                # If weaviate_api_key is not None or an empty string, add authentication
-                connection_params["auth_credentials"] = Auth.api_key(self.api_key)
+        slot = self._thread_slot()
+        with self._pool_locks[slot]:
+            client = self._pool[slot]
+            if client is None or not client.is_connected():
                 logger.info(
-                    "Connecting with API Key authentication with key of length {key_length}",
-                    key_length=len(self.api_key),
+                    "No connected weaviate client in pool slot {slot}, creating a new one",
+                    slot=slot,
                 )
-
-            self._client = weaviate.connect_to_custom(**connection_params)
-        return self._client
+                if client is not None:
+                    client.close()
+                client = weaviate.connect_to_custom(**self._connection_params())
+                self._pool[slot] = client
+        return client
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        if exc_type is not None and issubclass(exc_type, CONNECTION_ERRORS):
+            self.discard(self._pool[self._thread_slot()])
+
+    def hands_out(self, client: Any) -> bool:
+        """
+        Determine if the given client is one that this factory currently hands out.
+
+        :param client: the client to check
+        :return: True if the client is in the pool
+        """
+        return any(client is mine for mine in self._pool)
+
+    def discard(self, client: Optional[WeaviateClient]):
+        """
+        Close the given client and remove it from the pool, so that a new client is connected
+        the next time its pool slot is used. Used when a request failed to reach Weaviate.
+
+        :param client: the client to discard
+        """
+        if client is None:
+            return
+        for slot, lock in enumerate(self._pool_locks):
+            with lock:
+                if self._pool[slot] is client:
+                    logger.info(
+                        "Discarding the weaviate client in pool slot {slot}",
+                        slot=slot,
+                    )
+                    client.close()
+                    self._pool[slot] = None
+
+    def close(self):
+        """
+        Close all the clients in the pool.
+        """
+        for slot, lock in enumerate(self._pool_locks):
+            with lock:
+                if self._pool[slot] is not None:
+                    self._pool[slot].close()
+                    self._pool[slot] = None
+
+
+class AsyncWeaviateClientFactory(AbstractWeaviateClientFactory):
+    """
+    A factory to create asynchronous Weaviate clients. An asynchronous client is bound to the
+    event loop it was connected on, so the factory maintains one client per event loop, and
+    when that client is not connected, will create and connect a new one. Like the
+    `WeaviateClientFactory`, a client that fails to reach Weaviate is discarded. The clients
+    of event loops that have been closed are released.
+
+    This factory works like an asynchronous context manager, so can be used as follows:
+
+    ```
+    async with AsyncWeaviateClientFactory() as client:
+        client.collections. ...
+    ```
+
+    """
+
+    def __init__(self, config: dict[str, Any]):
+        super().__init__(config)
+        self._clients: dict[asyncio.AbstractEventLoop, WeaviateAsyncClient] = dict()
+        self._locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = dict()
+        self._loops_lock = threading.Lock()
+
+    def _loop_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        with self._loops_lock:
+            lock = self._locks.get(loop, None)
+            if lock is None:
+                self._release_closed_loops()
+                lock = self._locks[loop] = asyncio.Lock()
+            return lock
+
+    def _release_closed_loops(self):
+        # a client cannot be closed once its event loop is closed, so it is released,
+        # leaving its connections to be closed when the client is garbage collected
+        for loop in [loop for loop in self._locks if loop.is_closed()]:
+            if self._clients.pop(loop, None) is not None:
+                logger.info("Event loop closed, releasing its async weaviate client")
+            del self._locks[loop]
+
+    def hands_out(self, client: Any) -> bool:
+        """
+        Determine if the given client is one that this factory currently hands out.
+
+        :param client: the client to check
+        :return: True if the client is in use for one of the event loops
+        """
+        with self._loops_lock:
+            return any(client is mine for mine in self._clients.values())
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        async with self._loop_lock(loop):
+            client = self._clients.get(loop, None)
+            if client is None or not client.is_connected():
+                logger.info("No connected async weaviate client, creating a new one")
+                if client is not None:
+                    await client.close()
+                client = weaviate.use_async_with_custom(**self._connection_params())
+                await client.connect()
+                with self._loops_lock:
+                    self._clients[loop] = client
+        return client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None and issubclass(exc_type, CONNECTION_ERRORS):
+            await self.discard(self._clients.get(asyncio.get_running_loop(), None))
+
+    async def discard(self, client: Optional[WeaviateAsyncClient]):
+        """
+        Close the given client and stop handing it out, so that a new client is connected the
+        next time it is asked for. Used when a request failed to reach Weaviate.
+
+        :param client: the client to discard
+        """
+        with self._loops_lock:
+            loops = [loop for loop, mine in self._clients.items() if mine is client]
+            for loop in loops:
+                del self._clients[loop]
+        if client is not None and loops:
+            logger.info("Discarding the async weaviate client")
+            await client.close()
@@ -38,6 +38,13 @@ class WeaviateSimilaritySearchRequest(SimilaritySearchRequest):
     vector_name: Optional[str] = Field(
         default=None, description="The named vector for the similarity search"
     )
+    return_properties: Optional[list[str]] = Field(
+        default=None,
+        description=(
+            "The paths of the metadata and custom properties to retrieve, "
+            "each path leading to a single value"
+        ),
+    )
 
 
 class WeaviatePersistenceRequest(BaseModel):
@@ -52,9 +59,10 @@ class WeaviatePersistenceRequest(BaseModel):
     document: ChunkedDocument | list[ChunkedDocument] = Field(
         description="The document to persist",
     )
-    batch_size: int = Field(
-        default=1000,
-        description="The batch size for inserting chunks",
+    batch_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="The batch size for inserting chunks, defaults to the configured batch size",
     )
 
 
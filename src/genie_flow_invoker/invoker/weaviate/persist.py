@@ -1,23 +1,37 @@
-import re
-from collections import defaultdict
+import asyncio
+import itertools
+import time
 from typing import Optional, Any
+from uuid import UUID
 
 from genie_flow_invoker.doc_proc import ChunkedDocument, DocumentChunk
 from loguru import logger
 from weaviate.exceptions import UnexpectedStatusCodeError
 
 from .base import WeaviateClientProcessor
+from .client import AsyncWeaviateClientFactory, WeaviateClientFactory
 from weaviate.classes.config import (
     Configure,
     DataType,
     Property,
     ReferenceProperty,
 )
+from weaviate.classes.query import Filter
+from weaviate.collections import Collection, CollectionAsync
 from weaviate.collections.classes.data import DataObject
-from weaviate.collections import Collection
 
 from .properties import flatten_properties
 
+MAX_EXISTENCE_CHECK_SIZE = 1000
+MAX_CONCURRENT_BATCHES = 16
+MAX_TENANT_CREATE_SIZE = 100
+
+# the vector index types, with the quantizers that each of them supports
+VECTOR_INDEX_QUANTIZERS = {
+    "flat": ("bq",),
+    "hnsw": ("bq", "sq", "pq"),
+}
+
 
 def _compile_properties(params: dict):
     """
@@ -60,13 +74,47 @@ def _compile_multi_tenancy(params: dict):
     return Configure.multi_tenancy(**config)
 
 
+def _compile_vector_index(params: dict):
+    """
+    Compile the configuration of the vector index, defaulting to a flat index without
+    quantization. The index type can be set through a property `vector_index`, naming one of
+    the index types ("flat" or "hnsw"), and the vectors kept in the index can be compressed by
+    setting a property `quantizer` to one of the quantizers ("bq", "sq" or "pq"). Note that a
+    flat index only supports "bq".
+
+    :param params: the configuration parameters, potentially containing `vector_index` and
+                   `quantizer`
+    :return: the vector index configuration settings
+    """
+    vector_index = params.get("vector_index", "flat")
+    quantizer = params.get("quantizer", None)
+    if vector_index not in VECTOR_INDEX_QUANTIZERS:
+        logger.error("Unknown vector index '{vector_index}'", vector_index=vector_index)
+        raise ValueError(f"Unknown vector index '{vector_index}'")
+    if quantizer is not None and quantizer not in VECTOR_INDEX_QUANTIZERS[vector_index]:
+        logger.error(
+            "Quantizer '{quantizer}' is not supported by a {vector_index} index",
+            quantizer=quantizer,
+            vector_index=vector_index,
+        )
+        raise ValueError(
+            f"Quantizer '{quantizer}' is not supported by a {vector_index} index"
+        )
+
+    return getattr(Configure.VectorIndex, vector_index)(
+        quantizer=getattr(Configure.VectorIndex.Quantizer, quantizer)() if quantizer else None,
+    )
+
+
 def _compile_named_vectors(params: dict):
     """
-    Create the named vector configuration. This defaults to a named vector called "default" using
-    the "text2vec_huggingface" vectorizer and indexing property "content".
+    Create the named vector configuration. This defaults to a named vector called "default"
+    without a vectorizer, so the embeddings are expected to be given with the chunks.
 
     This default can be overridden by passing a dictionary under the key "named_vectors", where
-    `source_properties` and `vectorizer` are specified.
+    for every named vector the `vectorizer` is specified, together with any further settings of
+    that vectorizer, such as `source_properties`. Every named vector is indexed using the vector
+    index configuration, so a named vector cannot set its own `name` or `vector_index_config`.
 
     :param params: the configuration parameters, potentially containing a `named_vectors` dictionary
     :return: the named vector configuration settings
@@ -78,16 +126,41 @@ def _compile_named_vectors(params: dict):
         }
     }
     config.update(params.get("named_vectors", {}))
-    return params.get(
-        "named_vectors",
-        [
-            getattr(Configure.NamedVectors, value["vectorizer"])(
+
+    named_vectors = []
+    for key, value in config.items():
+        settings = dict(value)
+        vectorizer = settings.pop("vectorizer", None)
+        if (
+            not isinstance(vectorizer, str)
+            or vectorizer.startswith("_")
+            or not hasattr(Configure.NamedVectors, vectorizer)
+        ):
+            logger.error(
+                "Unknown vectorizer '{vectorizer}' for named vector '{vector_name}'",
+                vectorizer=vectorizer,
+                vector_name=key,
+            )
+            raise ValueError(f"Unknown vectorizer '{vectorizer}' for named vector '{key}'")
+        reserved_keys = sorted(settings.keys() & {"name", "vector_index_config"})
+        if reserved_keys:
+            logger.error(
+                "Named vector '{vector_name}' cannot set {reserved_keys}",
+                vector_name=key,
+                reserved_keys=reserved_keys,
+            )
+            raise ValueError(f"Named vector '{key}' cannot set {', '.join(reserved_keys)}")
+        if vectorizer == "none":
+            # without a vectorizer, there are no properties to vectorize
+            settings.pop("source_properties", None)
+        named_vectors.append(
+            getattr(Configure.NamedVectors, vectorizer)(
                 name=key,
-                vector_index_config=Configure.VectorIndex.flat(),
+                vector_index_config=_compile_vector_index(params),
+                **settings,
             )
-            for key, value in config.items()
-        ],
-    )
+        )
+    return named_vectors
 
 
 def _compile_cross_references(params: dict):
@@ -108,28 +181,109 @@ def _compile_cross_references(params: dict):
     ]
 
 
-def _build_properties(document: ChunkedDocument, chunk: DocumentChunk) -> dict[str, Any]:
+def _flatten_document_metadata(
+    document: ChunkedDocument,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """
+    Flatten the metadata of a document. The metadata is the same for every chunk of that
+    document, so it is flattened once per document rather than once per chunk.
+
+    :param document: the document to flatten the metadata of
+    :return: a tuple of the flat properties and the map of their flat names to their paths
+    """
+    flats = flatten_properties({"document_metadata": document.document_metadata})
+    return (
+        {prop.flat_name: prop.value for prop in flats},
+        {prop.flat_name: prop.path for prop in flats},
+    )
+
 
+def _build_properties(
+    document: ChunkedDocument,
+    chunk: DocumentChunk,
+    document_metadata: tuple[dict[str, Any], dict[str, str]],
+) -> dict[str, Any]:
+    metadata_properties, metadata_map = document_metadata
     props: dict[str, Any] = {
         "filename": document.filename,
         "content": chunk.content,
         "original_span_start": chunk.original_span[0],
         "original_span_end": chunk.original_span[1],
         "hierarchy_level": chunk.hierarchy_level,
+        **metadata_properties,
     }
-    properties_to_flatten = {
-        "document_metadata": document.document_metadata,
-        "custom_properties": chunk.custom_properties,
-    }
-    flats = flatten_properties(properties_to_flatten)
-    for prop in flats:
+    property_map = metadata_map.copy()
+    for prop in flatten_properties({"custom_properties": chunk.custom_properties}):
         props[prop.flat_name] = prop.value
-    props["property_map"] = {prop.flat_name: prop.path for prop in flats}
+        property_map[prop.flat_name] = prop.path
+    props["property_map"] = property_map
     return props
 
 
+def _data_object_params(
+    document: ChunkedDocument,
+    chunk: DocumentChunk,
+    document_metadata: tuple[dict[str, Any], dict[str, str]],
+    vector_name: str,
+) -> dict[str, Any]:
+    return dict(
+        uuid=chunk.chunk_id,
+        properties=_build_properties(document, chunk, document_metadata),
+        references={"parent": chunk.parent_id} if chunk.parent_id else None,
+        vector={vector_name: chunk.embedding} if chunk.embedding else None,
+    )
+
+
+def _check_batch_size(batch_size: int) -> int:
+    if batch_size < 1:
+        logger.error("Batch size should be positive, not {batch_size}", batch_size=batch_size)
+        raise ValueError(f"Batch size should be positive, not {batch_size}")
+    return batch_size
+
+
+def _order_chunks(
+    documents: list[ChunkedDocument],
+) -> list[tuple[DocumentChunk, ChunkedDocument]]:
+    """
+    Order the chunks of the given documents from top to bottom of the hierarchy. The sort is
+    stable, retaining the original order within a hierarchy level.
+
+    :param documents: the documents to order the chunks of
+    :return: a list of tuples of chunk and the document it belongs to
+    """
+    return sorted(
+        (
+            (chunk, document)
+            for document in documents
+            for chunk in document.chunks
+        ),
+        key=_chunk_hierarchy_level,
+    )
+
+
 class WeaviatePersistor(WeaviateClientProcessor):
 
+    def __init__(
+        self,
+        client_factory: WeaviateClientFactory,
+        processor_params: dict[str, Any],
+        async_client_factory: Optional[AsyncWeaviateClientFactory] = None,
+    ):
+        """
+        Creates a new persistor. The `processor_params` can contain `max_concurrency`, the
+        maximum number of batches of a hierarchy level that are inserted concurrently.
+        Defaults to 16. It can also contain `batch_size`, the number of chunks to insert in
+        a single batch, which defaults to the batch size of the client factory.
+        """
+        super().__init__(client_factory, processor_params, async_client_factory)
+        batch_size = processor_params.get("batch_size", None)
+        self.batch_size: Optional[int] = (
+            _check_batch_size(int(batch_size)) if batch_size is not None else None
+        )
+        self.max_concurrency = int(
+            processor_params.get("max_concurrency", MAX_CONCURRENT_BATCHES)
+        )
+
     def create_collection(
         self,
         persist_params: dict,
@@ -159,11 +313,7 @@ class WeaviatePersistor(WeaviateClientProcessor):
                     properties=_compile_properties(params.get("properties", {})),
                     multi_tenancy_config=_compile_multi_tenancy(params),
                     references=_compile_cross_references(params),
-                    vectorizer_config=[
-                        Configure.NamedVectors.none(
-                            name="default",
-                            vector_index_config=Configure.VectorIndex.flat()
-                        )],
+                    vectorizer_config=_compile_named_vectors(params),
                 )
             except UnexpectedStatusCodeError as e:
                 logger.error(
@@ -193,13 +343,42 @@ class WeaviatePersistor(WeaviateClientProcessor):
         collection.tenants.create([tenant_name])
         return collection.with_tenant(tenant_name)
 
+    def create_tenants(
+        self,
+        collection: Collection,
+        tenant_names: list[str],
+    ) -> list[str]:
+        """
+        Create a number of tenants for a collection. The existing tenants are retrieved in
+        one call, and the tenants that do not exist yet are created in as few calls as
+        possible. Tenants that already exist are skipped.
+
+        :param collection: the Collection to create the tenants in
+        :param tenant_names: the names of the tenants to add
+        :return: the names of the tenants that have been created
+        """
+        existing_tenant_names = set(collection.tenants.get().keys())
+        new_tenant_names = [
+            tenant_name
+            for tenant_name in dict.fromkeys(tenant_names)
+            if tenant_name not in existing_tenant_names
+        ]
+        logger.info(
+            "creating {nr_new} tenant(s) in collection '{collection_name}'",
+            nr_new=len(new_tenant_names),
+            collection_name=collection.name,
+        )
+        for start in range(0, len(new_tenant_names), MAX_TENANT_CREATE_SIZE):
+            collection.tenants.create(new_tenant_names[start:start + MAX_TENANT_CREATE_SIZE])
+        return new_tenant_names
+
     def persist_document(
         self,
         document: ChunkedDocument | list[ChunkedDocument],
         collection_name: Optional[str] = None,
         tenant_name: Optional[str] = None,
         vector_name: str = "default",
-        batch_size: int = 1000,
+        batch_size: Optional[int] = None,
     ) -> tuple[str, Optional[str], int, int]:
         """
         Persist a given chunked document or a list of chunked documents into a collection with the 
@@ -212,7 +391,8 @@ class WeaviatePersistor(WeaviateClientProcessor):
         :param collection_name: the name of the collection to store it into
         :param tenant_name: an Optional name of a tenant to store the document into.
         :param vector_name: the name of the vector to store the document embeddings into.
-        :param batch_size: the number of chunks to insert in a single batch
+        :param batch_size: the number of chunks to insert in a single batch, defaults to the
+                           batch size configured for the persistor or else the client factory
         :return: tuple of the used collection_name and tenant_name, nr_inserted and nr_replaces,
                 respectively the number of inserted and replaced chunks
         """
@@ -220,17 +400,19 @@ class WeaviatePersistor(WeaviateClientProcessor):
             collection_name, tenant_name
         )
 
+        batch_size = _check_batch_size(
+            batch_size or self.batch_size or self.client_factory.batch_size
+        )
+
         documents = [document] if not isinstance(document, list) else document
         del document  # unbind this variable to avoid confusion with loop variable
 
-        chunk_index: dict[int, list[tuple[DocumentChunk, ChunkedDocument]]] = defaultdict(list)
-        nr_chunks = 0
-        nr_files = 0
-        for document in documents:
-            nr_files += 1
-            for chunk in document.chunks:
-                nr_chunks += 1
-                chunk_index[chunk.hierarchy_level].append((chunk, document))
+        ordered_chunks = _order_chunks(documents)
+        nr_chunks = len(ordered_chunks)
+        nr_files = len(documents)
+        document_metadata = {
+            id(document): _flatten_document_metadata(document) for document in documents
+        }
 
         with self.client_factory as client:
             logger.debug(
@@ -273,57 +455,220 @@ class WeaviatePersistor(WeaviateClientProcessor):
             nr_files=nr_files,
         )
 
+        # find out which chunks already exist, in one query rather than one per chunk
+        existing_chunk_ids = _existing_chunk_ids(
+            collection,
+            [chunk.chunk_id for chunk, _ in ordered_chunks],
+        )
+
         # making sure we add the chunks from top to bottom
         nr_inserted = 0
         nr_replaced = 0
-        hierarchy_levels = sorted(chunk_index.keys())
-        for hierarchy_level in hierarchy_levels:
-            chunks = chunk_index[hierarchy_level]
+        for hierarchy_level, chunks in itertools.groupby(
+            ordered_chunks, key=_chunk_hierarchy_level
+        ):
+            level_chunks = list(chunks)
+            start_time = time.monotonic()
+            # a batch insert of an existing uuid overwrites that object, so existing
+            # chunks are replaced through the same batch. Leaving the batch context sends
+            # the remaining objects, so the parents exist before their children are added.
+            with collection.batch.fixed_size(
+                batch_size=batch_size,
+                concurrent_requests=self.max_concurrency,
+            ) as batch:
+                for chunk, document in level_chunks:
+                    if UUID(chunk.chunk_id) in existing_chunk_ids:
+                        nr_replaced += 1
+                    else:
+                        nr_inserted += 1
+                    batch.add_object(
+                        **_data_object_params(
+                            document, chunk, document_metadata[id(document)], vector_name
+                        )
+                    )
+
+            for failed_object in collection.batch.failed_objects:
+                logger.error(
+                    "failed to persist chunk with id {chunk_id}, error={error}",
+                    chunk_id=failed_object.object_.uuid,
+                    error=failed_object.message,
+                )
+                if UUID(str(failed_object.object_.uuid)) in existing_chunk_ids:
+                    nr_replaced -= 1
+                else:
+                    nr_inserted -= 1
             logger.debug(
-                "persisting {nr_chunks} chunk(s) at hierarchy level {hierarchy_level}",
-                nr_chunks=len(chunks),
+                "persisted {nr_chunks} chunk(s) at hierarchy level {hierarchy_level} "
+                "in {duration:.3f}s",
+                nr_chunks=len(level_chunks),
                 hierarchy_level=hierarchy_level,
+                duration=time.monotonic() - start_time,
             )
-            chunk_buffer = []
-            for chunk, document in chunks:
-                properties = _build_properties(document, chunk)
-                references = {"parent": chunk.parent_id} if chunk.parent_id else None
-                vector = {vector_name: chunk.embedding} if chunk.embedding else None
-
-                if not collection.data.exists(chunk.chunk_id):
-                    logger.debug("adding chunk with id {chunk_id} to buffer", chunk_id=chunk.chunk_id)
-                    chunk_buffer.append(
+        return collection_name, tenant_name, nr_inserted, nr_replaced
+
+    async def apersist_document(
+        self,
+        document: ChunkedDocument | list[ChunkedDocument],
+        collection_name: Optional[str] = None,
+        tenant_name: Optional[str] = None,
+        vector_name: str = "default",
+        batch_size: Optional[int] = None,
+    ) -> tuple[str, Optional[str], int, int]:
+        """
+        The asynchronous counterpart of `persist_document`. The chunks of a hierarchy level
+        are split into batches that are inserted concurrently, using the asynchronous Weaviate
+        client. A level is completed before the next one is started, so parents exist before
+        their children are added.
+
+        :param document: the `ChunkedDocument` to persist
+        :param collection_name: the name of the collection to store it into
+        :param tenant_name: an Optional name of a tenant to store the document into.
+        :param vector_name: the name of the vector to store the document embeddings into.
+        :param batch_size: the number of chunks to insert in a single batch, defaults to the
+                           batch size configured for the persistor or else the client factory
+        :return: tuple of the used collection_name and tenant_name, nr_inserted and nr_replaces,
+                respectively the number of inserted and replaced chunks
+        """
+        collection_name, tenant_name = self.compile_collection_tenant_names(
+            collection_name, tenant_name
+        )
+
+        batch_size = _check_batch_size(
+            batch_size or self.batch_size or self.client_factory.batch_size
+        )
+
+        documents = [document] if not isinstance(document, list) else document
+        del document  # unbind this variable to avoid confusion with loop variable
+
+        ordered_chunks = _order_chunks(documents)
+        document_metadata = {
+            id(document): _flatten_document_metadata(document) for document in documents
+        }
+
+        collection = await self.aget_collection_or_tenant(collection_name, tenant_name)
+        logger.info(
+            "Connected to collection '{collection_name}', persisting {nr_chunks} chunks, "
+            "for '{nr_files}' files",
+            collection_name=collection.name,
+            nr_chunks=len(ordered_chunks),
+            nr_files=len(documents),
+        )
+
+        existing_chunk_ids = await _aexisting_chunk_ids(
+            collection,
+            [chunk.chunk_id for chunk, _ in ordered_chunks],
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def insert_batch(chunk_slice: list[tuple[DocumentChunk, ChunkedDocument]]):
+            # the data objects are only built once a slot is free, so no more than
+            # max_concurrency batches are held in memory at any time
+            async with semaphore:
+                logger.debug(
+                    "inserting batch of {batch_size} chunks",
+                    batch_size=len(chunk_slice),
+                )
+                return await collection.data.insert_many(
+                    [
                         DataObject(
-                            uuid=chunk.chunk_id,
-                            properties=properties,
-                            references=references,
-                            vector=vector,
+                            **_data_object_params(
+                                document, chunk, document_metadata[id(document)], vector_name
+                            )
                         )
+                        for chunk, document in chunk_slice
+                    ]
+                )
+
+        nr_inserted = 0
+        nr_replaced = 0
+        for hierarchy_level, chunks in itertools.groupby(
+            ordered_chunks, key=_chunk_hierarchy_level
+        ):
+            level_chunks = list(chunks)
+            start_time = time.monotonic()
+            batch_results = await asyncio.gather(
+                *(
+                    insert_batch(level_chunks[start:start + batch_size])
+                    for start in range(0, len(level_chunks), batch_size)
+                )
+            )
+
+            failed_chunk_ids: set[UUID] = set()
+            for batch_result in batch_results:
+                for error in batch_result.errors.values():
+                    logger.error(
+                        "failed to persist chunk with id {chunk_id}, error={error}",
+                        chunk_id=error.object_.uuid,
+                        error=error.message,
                     )
-                else:
-                    logger.debug("replacing chunk with id {chunk_id}", chunk_id=chunk.chunk_id)
-                    # TODO: use batch replace when available - weaviate currently does not support batch replace
-                    collection.data.replace(
-                        uuid=chunk.chunk_id,  # type: ignore
-                        properties=properties,
-                        references=references, # potential issue: parent not existing in weaviate
-                        vector=vector,
-                    )
+                    failed_chunk_ids.add(UUID(str(error.object_.uuid)))
+            for chunk, _ in level_chunks:
+                chunk_id = UUID(chunk.chunk_id)
+                if chunk_id in failed_chunk_ids:
+                    continue
+                if chunk_id in existing_chunk_ids:
                     nr_replaced += 1
-
-                while len(chunk_buffer) >= batch_size:
-                    nr_inserted += drain_buffer(collection, chunk_buffer)
-                    
-            # drain remaining buffer
-            nr_inserted += drain_buffer(collection, chunk_buffer)
+                else:
+                    nr_inserted += 1
+            logger.debug(
+                "persisted {nr_chunks} chunk(s) at hierarchy level {hierarchy_level} "
+                "in {duration:.3f}s",
+                nr_chunks=len(level_chunks),
+                hierarchy_level=hierarchy_level,
+                duration=time.monotonic() - start_time,
+            )
         return collection_name, tenant_name, nr_inserted, nr_replaced
 
 
-def drain_buffer(collection: Collection, chunk_buffer: list[DataObject]) -> int:
-    if chunk_buffer:
-        logger.debug("inserting batch of {batch_size} chunks", batch_size=len(chunk_buffer))
-        collection.data.insert_many(chunk_buffer)
-        nr_inserted = len(chunk_buffer)
-        chunk_buffer.clear()
-        return nr_inserted
-    return 0
\ No newline at end of file
+def _chunk_hierarchy_level(chunk_document: tuple[DocumentChunk, ChunkedDocument]) -> int:
+    return chunk_document[0].hierarchy_level
+
+
+def _existing_chunk_ids(collection: Collection, chunk_ids: list[str]) -> set[UUID]:
+    """
+    Retrieve which of the given chunk ids already exist in the collection. This is done
+    using a query that filters on the ids, retrieving no properties. Large numbers of ids
+    are checked in slices, keeping both the filter and the result within server limits.
+
+    :param collection: the collection (or tenant) to look into
+    :param chunk_ids: the ids of the chunks to check
+    :return: the set of chunk ids that already exist
+    """
+    existing_chunk_ids: set[UUID] = set()
+    for start in range(0, len(chunk_ids), MAX_EXISTENCE_CHECK_SIZE):
+        chunk_id_slice = chunk_ids[start:start + MAX_EXISTENCE_CHECK_SIZE]
+        response = collection.query.fetch_objects(
+            filters=Filter.by_id().contains_any(chunk_id_slice),
+            limit=len(chunk_id_slice),
+            return_properties=[],
+        )
+        existing_chunk_ids.update(o.uuid for o in response.objects)
+    logger.debug(
+        "found {nr_existing} existing chunk(s) out of {nr_chunks}",
+        nr_existing=len(existing_chunk_ids),
+        nr_chunks=len(chunk_ids),
+    )
+    return existing_chunk_ids
+
+
+async def _aexisting_chunk_ids(
+    collection: CollectionAsync, chunk_ids: list[str]
+) -> set[UUID]:
+    """
+    The asynchronous counterpart of `_existing_chunk_ids`.
+
+    :param collection: the collection (or tenant) to look into
+    :param chunk_ids: the ids of the chunks to check
+    :return: the set of chunk ids that already exist
+    """
+    existing_chunk_ids: set[UUID] = set()
+    for start in range(0, len(chunk_ids), MAX_EXISTENCE_CHECK_SIZE):
+        chunk_id_slice = chunk_ids[start:start + MAX_EXISTENCE_CHECK_SIZE]
+        response = await collection.query.fetch_objects(
+            filters=Filter.by_id().contains_any(chunk_id_slice),
+            limit=len(chunk_id_slice),
+            return_properties=[],
+        )
+        existing_chunk_ids.update(o.uuid for o in response.objects)
+    return existing_chunk_ids
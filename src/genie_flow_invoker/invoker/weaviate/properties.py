@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import md5
 from typing import Any
 
@@ -13,6 +14,12 @@ def create_flat_name(path: str | list[str]) -> str:
     """
     if isinstance(path, list):
         path = ".".join(path)
+    return _hashed_flat_name(path)
+
+
+@lru_cache(maxsize=1024)
+def _hashed_flat_name(path: str) -> str:
+    # the same property paths recur for every chunk, so their hashes are remembered
     path_hash = md5(path.encode("utf-8")).hexdigest()
     return f"property_{path_hash}"
 
@@ -1,23 +1,42 @@
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from inspect import signature, Parameter
-from typing import Any, Callable, Optional, TypeAlias
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from inspect import signature
+from typing import Any, Callable, Iterator, Optional, TypeAlias
 
 from genie_flow_invoker.doc_proc import ChunkedDocument, DocumentChunk
 from loguru import logger
 from pydantic import TypeAdapter
 from weaviate.collections.classes.aggregate import AggregateReturn
 
-from genie_flow_invoker.invoker.weaviate import WeaviateClientFactory
+from genie_flow_invoker.invoker.weaviate.client import (
+    CONNECTION_ERRORS,
+    AsyncWeaviateClientFactory,
+    WeaviateClientFactory,
+)
 from genie_flow_invoker.invoker.weaviate.base import WeaviateClientProcessor
-from genie_flow_invoker.invoker.weaviate.properties import unmap_properties
+from genie_flow_invoker.invoker.weaviate.properties import (
+    create_flat_name,
+    unmap_properties,
+)
 from genie_flow_invoker.invoker.weaviate.utils import compile_filter
 from weaviate.classes.query import Filter, Metrics, QueryReference
-from weaviate.collections import Collection
+from weaviate.collections import Collection, CollectionAsync
 from weaviate.collections.classes.internal import Object
+from weaviate import WeaviateAsyncClient, WeaviateClient
 
 
 ChunkedDocumentList: TypeAlias = list[ChunkedDocument]
 ChunkedDocumentListModel = TypeAdapter(ChunkedDocumentList)
+ChunkedDocumentBatchModel = TypeAdapter(list[ChunkedDocumentList])
+
+MAX_BATCH_SIZE = 100
+MAX_BATCH_WORKERS = 16
+MAX_CACHED_COLLECTIONS = 128
+MAX_LEVEL_TTL = 60.0
 
 
 def compile_chunked_documents(
@@ -50,9 +69,13 @@ def compile_chunked_documents(
     )
     for o in query_results:
         properties: dict[str, Any] = o.properties
-        property_map = properties.get("property_map", {})
-        unflattened_properties = unmap_properties(properties, property_map)
-        chunk = DocumentChunk(
+        references = o.references
+        vector = o.vector
+        unflattened_properties = unmap_properties(
+            properties, properties.get("property_map", {})
+        )
+        # the objects were validated when they were persisted, so skip validation here
+        chunk = DocumentChunk.model_construct(
             chunk_id=str(o.uuid),
             content=properties["content"],
             original_span=(
@@ -61,26 +84,24 @@ def compile_chunked_documents(
             ),
             hierarchy_level=properties["hierarchy_level"],
             custom_properties=unflattened_properties.get("custom_properties", {}),
-            parent_id=str(o.references["parent"].objects[0].uuid) if o.references else None,
-            embedding=o.vector[named_vector] if o.vector is not None and len(o.vector) > 0 else None,
+            parent_id=str(references["parent"].objects[0].uuid) if references else None,
+            embedding=vector[named_vector] if vector else None,
         )
+        filename = properties["filename"]
+        document = document_index.get(filename)
+        if document is not None:
+            document.chunks.append(chunk)
+            continue
+
         logger.debug(
-            "created a chunk with id {chunk_id}",
-            **chunk.model_dump(),
+            "creating a new ChunkedDocument for filename {filename}",
+            filename=filename,
+        )
+        document_index[filename] = ChunkedDocument.model_construct(
+            filename=filename,
+            document_metadata=unflattened_properties.get("document_metadata", {}),
+            chunks=[chunk],
         )
-        filename = properties["filename"]
-        try:
-            document_index[filename].chunks.append(chunk)
-        except KeyError:
-            logger.debug(
-                "creating a new ChunkedDocument for filename {filename}",
-                filename=filename,
-            )
-            document_index[filename] = ChunkedDocument(
-                filename=filename,
-                document_metadata=unflattened_properties.get("document_metadata", {}),
-                chunks=[chunk],
-            )
     logger.debug(
         "created {nr_documents} chunked documents containing "
         "a total of {nr_chunks} chunks",
@@ -90,65 +111,200 @@ def compile_chunked_documents(
     return [document for document in document_index.values()]
 
 
-def _calculate_operation_level(
-    collection: Collection, operation_level: Optional[int]
-) -> int:
-    logger.debug(
-        "calculating operation level {operation_level}",
-        operation_level=operation_level,
-    )
-    response = collection.aggregate.over_all(
-        return_metrics=Metrics("hierarchy_level").integer(maximum=True),
-    )
+_FILTER_PARAMETERS = ("having_all", "having_any")
+_PARAMETER_TRANSLATIONS = (
+    ("top", "limit"),
+    ("horizon", "distance"),
+)
+_PARENT_REFERENCES = [QueryReference(link_on="parent")]
+
+
+_CHUNK_PROPERTIES = (
+    "filename",
+    "content",
+    "original_span_start",
+    "original_span_end",
+    "hierarchy_level",
+    "property_map",
+)
+
+
+@lru_cache(maxsize=32)
+def _compile_return_properties(property_paths: tuple[str, ...]) -> list[str]:
+    return [
+        *_CHUNK_PROPERTIES,
+        *(create_flat_name(path) for path in property_paths),
+    ]
+
+
+def _property_paths(return_properties: str | list[str]) -> tuple[str, ...]:
+    # a single path, as can be configured in meta.yaml, is not split into its characters
+    if isinstance(return_properties, str):
+        return (return_properties,)
+    if not isinstance(return_properties, (list, tuple)):
+        logger.error(
+            "return_properties should be a list of property paths, not {type_name}",
+            type_name=type(return_properties).__name__,
+        )
+        raise ValueError("return_properties should be a list of property paths")
+    return tuple(return_properties)
+
+
+@lru_cache(maxsize=32)
+def _hierarchy_filter(operation_level: int) -> Filter:
+    return Filter.by_property("hierarchy_level").equal(operation_level)
+
+
+def _max_hierarchy_level(collection_name: str, response: Any) -> int:
     if response is None or not isinstance(response, AggregateReturn):
         logger.error(
             "Failed to retrieve maximum hierarchy level for collection '{collection_name}'",
-            collection_name=collection.name,
+            collection_name=collection_name,
         )
         raise ValueError(
-            f"Failed to retrieve maximum hierarchy level for collection '{collection.name}'"
+            f"Failed to retrieve maximum hierarchy level for collection '{collection_name}'"
         )
     logger.debug(
         "found highest hierarchy level {max_hierarchy_level}",
         max_hierarchy_level=response.properties["hierarchy_level"].maximum,
     )
-    return response.properties["hierarchy_level"].maximum + operation_level + 1
+    return response.properties["hierarchy_level"].maximum
+
+
+def _query_max_hierarchy_level(collection: Collection) -> int:
+    logger.debug(
+        "retrieving maximum hierarchy level for collection {collection_name}",
+        collection_name=collection.name,
+    )
+    response = collection.aggregate.over_all(
+        return_metrics=Metrics("hierarchy_level").integer(maximum=True),
+    )
+    return _max_hierarchy_level(collection.name, response)
+
+
+async def _aquery_max_hierarchy_level(collection: CollectionAsync) -> int:
+    logger.debug(
+        "retrieving maximum hierarchy level for collection {collection_name}",
+        collection_name=collection.name,
+    )
+    response = await collection.aggregate.over_all(
+        return_metrics=Metrics("hierarchy_level").integer(maximum=True),
+    )
+    return _max_hierarchy_level(collection.name, response)
+
+
+def _iterate_parents(query_results: list[Object]) -> Iterator[Object]:
+    for child in query_results:
+        if child.references is not None:
+            yield from child.references["parent"].objects
+
+
+def _deduplicate_queries(queries: list[Any]) -> tuple[list[Any], list[int]]:
+    """
+    Deduplicate a batch of queries, retaining their order. Vector queries are lists, so
+    they are keyed by their tuple.
+
+    :param queries: the list of queries, potentially containing duplicates
+    :return: a tuple of the unique queries and, for every query, the index of its unique query
+    """
+    unique_index: dict[Any, int] = dict()
+    unique_queries = []
+    positions = []
+    for query in queries:
+        key = tuple(query) if isinstance(query, list) else query
+        if key not in unique_index:
+            unique_index[key] = len(unique_queries)
+            unique_queries.append(query)
+        positions.append(unique_index[key])
+    return unique_queries, positions
+
+
+_SEARCH_PARAMETERS: dict[Callable, tuple[tuple[str, Any], ...]] = dict()
+
+
+def _search_parameters(search_function: Callable) -> tuple[tuple[str, Any], ...]:
+    # search functions are bound to a collection, so key on the function underneath
+    function_key = getattr(search_function, "__func__", search_function)
+    try:
+        return _SEARCH_PARAMETERS[function_key]
+    except KeyError:
+        function_parameters = tuple(
+            (name, param.default)
+            for name, param in signature(search_function).parameters.items()
+        )
+        _SEARCH_PARAMETERS[function_key] = function_parameters
+        return function_parameters
+
+
+def _check_batch_size(queries: list[Any]):
+    if len(queries) > MAX_BATCH_SIZE:
+        logger.error(
+            "received a batch of {nr_queries} queries, maximum is {max_batch_size}",
+            nr_queries=len(queries),
+            max_batch_size=MAX_BATCH_SIZE,
+        )
+        raise ValueError(
+            f"Batch of {len(queries)} queries exceeds maximum of {MAX_BATCH_SIZE}"
+        )
+
+
+def _cast_or_none(dictionary: dict, key: str, data_type: type) -> Any:
+    try:
+        return data_type(dictionary[key])
+    except (KeyError, TypeError):
+        return None
+
+
+def _compile_base_query_params(query_params: dict) -> dict[str, Any]:
+    return dict(
+        parent_strategy=query_params.get("parent_strategy", None),
+        operation_level=query_params.get("operation_level", None),
+        having_all=query_params.get("having_all", None),
+        having_any=query_params.get("having_any", None),
+        vector_name=query_params.get("vector_name", None),
+        include_vector=bool(query_params.get("include_vector", False)),
+        method=query_params.get("method", "cosine"),
+        return_properties=query_params.get("return_properties", None),
+        limit=_cast_or_none(query_params, "top", int),
+        distance=_cast_or_none(query_params, "horizon", float),
+    )
 
 
 class AbstractSearcher(WeaviateClientProcessor, ABC):
+    query_parameter: str
 
-    def __init__(self, client_factory: WeaviateClientFactory, query_params: dict):
+    def __init__(
+        self,
+        client_factory: WeaviateClientFactory,
+        query_params: dict,
+        async_client_factory: Optional[AsyncWeaviateClientFactory] = None,
+    ):
         super().__init__(
             client_factory,
             {
                 "collection_name": query_params.get("collection_name", None),
                 "tenant_name": query_params.get("tenant_name", None),
             },
+            async_client_factory,
         )
-
-        def cast_or_none(dictionary: dict, key: str, data_type: type):
-            try:
-                return data_type(dictionary[key])
-            except (KeyError, TypeError):
-                return None
-
-        self.base_query_params = dict(
-            parent_strategy=query_params.get("parent_strategy", None),
-            operation_level=query_params.get("operation_level", None),
-            having_all=query_params.get("having_all", None),
-            having_any=query_params.get("having_any", None),
-            vector_name=query_params.get("vector_name", None),
-            include_vector=bool(query_params.get("include_vector", False)),
-            method=query_params.get("method", "cosine"),
-            limit=cast_or_none(query_params, "top", int),
-            distance=cast_or_none(query_params, "horizon", float),
-        )
+        self._collection_cache: dict[
+            tuple[int, str, Optional[str]],
+            tuple[WeaviateClient | WeaviateAsyncClient, Collection | CollectionAsync],
+        ] = dict()
+        self._collection_lock = threading.Lock()
+        self._max_level_cache: dict[tuple[str, Optional[str]], tuple[float, int]] = dict()
+        self._max_level_ttl = float(query_params.get("max_level_ttl", MAX_LEVEL_TTL))
+
+        self.base_query_params = _compile_base_query_params(query_params)
         logger.debug(
             "setting base query parameters to {base_params}",
             base_params=str(self.base_query_params),
             **self.base_query_params,
         )
 
+        # the configured filter does not change, so it is compiled once
+        self._base_filter = compile_filter(self.base_query_params)
+
     def create_query_params(self, **kwargs) -> dict[str, Any]:
         """
         Creates a dictionary of parameters to pass into the search functions of Weaviate.
@@ -174,6 +330,57 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
         :param kwargs: additional keyword arguments to pass to weaviate
         :return: a dictionary of query parameters to be used
         """
+        query_params = self._compile_query_params(**kwargs)
+        collection = self._get_cached_collection_or_tenant(query_params)
+        query_params["collection"] = collection
+
+        # if we need to operate at a certain level, filter on that level
+        operation_level = query_params["operation_level"]
+        if operation_level is not None:
+            if operation_level < 0:
+                max_level = self._get_cached_max_level(query_params)
+                if max_level is None:
+                    max_level = _query_max_hierarchy_level(collection)
+                    self._cache_max_level(query_params, max_level)
+                operation_level = max_level + operation_level + 1
+            self._add_hierarchy_filter(query_params, operation_level)
+
+        logger.debug(
+            "created query parameters for keys: {param_keys}",
+            param_keys=query_params.keys(),
+        )
+        return query_params
+
+    async def acreate_query_params(self, **kwargs) -> dict[str, Any]:
+        """
+        The asynchronous counterpart of `create_query_params`. The collection (or tenant) is
+        retrieved using the asynchronous client, and so is the maximum hierarchy level when
+        operating at a negative level.
+
+        :param kwargs: additional keyword arguments to pass to weaviate
+        :return: a dictionary of query parameters to be used
+        """
+        query_params = self._compile_query_params(**kwargs)
+        collection = await self._aget_cached_collection_or_tenant(query_params)
+        query_params["collection"] = collection
+
+        operation_level = query_params["operation_level"]
+        if operation_level is not None:
+            if operation_level < 0:
+                max_level = self._get_cached_max_level(query_params)
+                if max_level is None:
+                    max_level = await _aquery_max_hierarchy_level(collection)
+                    self._cache_max_level(query_params, max_level)
+                operation_level = max_level + operation_level + 1
+            self._add_hierarchy_filter(query_params, operation_level)
+
+        logger.debug(
+            "created query parameters for keys: {param_keys}",
+            param_keys=query_params.keys(),
+        )
+        return query_params
+
+    def _compile_query_params(self, **kwargs) -> dict[str, Any]:
         logger.debug(
             "creating query parameters using kwargs {kwargs}",
             kwargs=str(kwargs),
@@ -183,14 +390,7 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
             if kwarg_v is not None:
                 query_params[kwarg_k] = kwarg_v
 
-        collection = self.get_collection_or_tenant(query_params)
-        query_params["collection"] = collection
-
-        translations = {
-            "top": "limit",
-            "horizon": "distance",
-        }
-        for genie_param, weaviate_param in translations.items():
+        for genie_param, weaviate_param in _PARAMETER_TRANSLATIONS:
             if genie_param in query_params:
                 if query_params[genie_param] is not None:
                     query_params[weaviate_param] = query_params[genie_param]
@@ -203,29 +403,187 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
             else "default"
         )
 
-        # if we have a filter, include that into the query parameters
-        query_params["filters"] = compile_filter(query_params)
+        # if we have a filter, include that into the query parameters, only compiling
+        # a new filter when the configured one is overridden
+        if any(kwargs.get(key, None) is not None for key in _FILTER_PARAMETERS):
+            query_params["filters"] = compile_filter(query_params)
+        else:
+            query_params["filters"] = self._base_filter
+
+        # only retrieve the properties asked for, plus the ones that make up a chunk
+        if query_params["return_properties"] is not None:
+            query_params["return_properties"] = _compile_return_properties(
+                _property_paths(query_params["return_properties"])
+            )
 
         # if we need the parents, pull in the references too
         if query_params["parent_strategy"] is not None:
-            query_params["return_references"] = [QueryReference(link_on="parent")]
+            query_params["return_references"] = _PARENT_REFERENCES
 
-        # if we need to operate at a certain level, filter on that level
-        if query_params["operation_level"] is not None:
-            operation_level = query_params["operation_level"]
-            if operation_level < 0:
-                operation_level = _calculate_operation_level(collection, operation_level)
-            hierarchy_filter = Filter.by_property("hierarchy_level").equal(operation_level)
-            if query_params["filters"] is not None:
-                query_params["filters"] &= hierarchy_filter
-            else:
-                query_params["filters"] = hierarchy_filter
+        return query_params
 
-        logger.debug(
-            "created query parameters for keys: {param_keys}",
-            param_keys=query_params.keys(),
+    def _get_cached_collection_or_tenant(self, query_params: dict[str, Any]) -> Collection:
+        """
+        Retrieve the collection, or tenant within that collection, that the query params
+        refer to. Once retrieved, the collection is cached for the client that it was
+        retrieved with, so it is reused for as long as the client factory hands out that
+        same client. When a search on the collection fails to reach Weaviate, the collection
+        is evicted and its client is discarded, so both are retrieved anew.
+
+        :param query_params: the query parameters, potentially containing a collection and
+                             tenant name
+        :return: the collection, or the tenant of that collection
+        """
+        collection_name, tenant_name = self.compile_collection_tenant_names(
+            query_params.get("collection_name", None),
+            query_params.get("tenant_name", None),
         )
-        return query_params
+        with self.client_factory as client:
+            cached = self._get_cached_collection(client, collection_name, tenant_name)
+            if cached is not None:
+                return cached
+
+            logger.debug(
+                "retrieving collection {collection_name} and tenant {tenant_name}",
+                collection_name=collection_name,
+                tenant_name=tenant_name,
+            )
+            collection = self.get_collection_or_tenant(collection_name, tenant_name)
+            self._cache_collection(client, collection_name, tenant_name, collection)
+            return collection
+
+    async def _aget_cached_collection_or_tenant(
+        self, query_params: dict[str, Any]
+    ) -> CollectionAsync:
+        """
+        The asynchronous counterpart of `_get_cached_collection_or_tenant`, caching the
+        collection for the async client that it was retrieved with.
+
+        :param query_params: the query parameters, potentially containing a collection and
+                             tenant name
+        :return: the collection, or the tenant of that collection
+        """
+        if self.async_client_factory is None:
+            logger.error("No async client factory configured for this searcher")
+            raise ValueError("Cannot search asynchronously without an async client factory")
+
+        collection_name, tenant_name = self.compile_collection_tenant_names(
+            query_params.get("collection_name", None),
+            query_params.get("tenant_name", None),
+        )
+        async with self.async_client_factory as client:
+            cached = self._get_cached_collection(client, collection_name, tenant_name)
+            if cached is not None:
+                return cached
+
+            logger.debug(
+                "retrieving async collection {collection_name} and tenant {tenant_name}",
+                collection_name=collection_name,
+                tenant_name=tenant_name,
+            )
+            collection = await self.aget_collection_or_tenant(collection_name, tenant_name)
+            self._cache_collection(client, collection_name, tenant_name, collection)
+            return collection
+
+    def _get_cached_collection(
+        self,
+        client: WeaviateClient | WeaviateAsyncClient,
+        collection_name: str,
+        tenant_name: Optional[str],
+    ) -> Optional[Collection | CollectionAsync]:
+        with self._collection_lock:
+            cached = self._collection_cache.get(
+                (id(client), collection_name, tenant_name), None
+            )
+        if cached is not None and cached[0] is client:
+            return cached[1]
+        return None
+
+    def _evict_cached_collection(
+        self, collection: Collection | CollectionAsync
+    ) -> list[WeaviateClient | WeaviateAsyncClient]:
+        """
+        Remove a collection from the cache, after a request on it failed to reach Weaviate.
+
+        :param collection: the collection to remove
+        :return: the clients that the collection was cached for
+        """
+        with self._collection_lock:
+            cache_keys = [
+                cache_key
+                for cache_key, (_, cached) in self._collection_cache.items()
+                if cached is collection
+            ]
+            return [self._collection_cache.pop(cache_key)[0] for cache_key in cache_keys]
+
+    def _hands_out(self, client: WeaviateClient | WeaviateAsyncClient) -> bool:
+        return self.client_factory.hands_out(client) or (
+            self.async_client_factory is not None
+            and self.async_client_factory.hands_out(client)
+        )
+
+    def _cache_collection(
+        self,
+        client: WeaviateClient | WeaviateAsyncClient,
+        collection_name: str,
+        tenant_name: Optional[str],
+        collection: Collection | CollectionAsync,
+    ):
+        with self._collection_lock:
+            # drop the entries of clients that the client factories have replaced or released
+            for cache_key in [
+                cache_key
+                for cache_key, (cached_client, _) in self._collection_cache.items()
+                if not self._hands_out(cached_client)
+            ]:
+                del self._collection_cache[cache_key]
+            if len(self._collection_cache) >= MAX_CACHED_COLLECTIONS:
+                # drop entries of clients that may no longer be in use
+                self._collection_cache.clear()
+            self._collection_cache[(id(client), collection_name, tenant_name)] = (
+                client,
+                collection,
+            )
+
+    def _max_level_cache_key(
+        self, query_params: dict[str, Any]
+    ) -> tuple[str, Optional[str]]:
+        return self.compile_collection_tenant_names(
+            query_params.get("collection_name", None),
+            query_params.get("tenant_name", None),
+        )
+
+    def _get_cached_max_level(self, query_params: dict[str, Any]) -> Optional[int]:
+        cached = self._max_level_cache.get(self._max_level_cache_key(query_params), None)
+        if cached is None or time.monotonic() - cached[0] >= self._max_level_ttl:
+            return None
+        return cached[1]
+
+    def _cache_max_level(self, query_params: dict[str, Any], max_level: int):
+        self._max_level_cache[self._max_level_cache_key(query_params)] = (
+            time.monotonic(),
+            max_level,
+        )
+
+    def refresh(self):
+        """
+        Forget the cached collections and maximum hierarchy levels, so that the next search
+        looks up its collection (and tenant) again, and a search at a negative operation level
+        retrieves the maximum level from Weaviate again. Use this after collections or tenants
+        have been deleted or recreated.
+        """
+        logger.debug("clearing cached collections and maximum hierarchy levels")
+        with self._collection_lock:
+            self._collection_cache.clear()
+        self._max_level_cache.clear()
+
+    @staticmethod
+    def _add_hierarchy_filter(query_params: dict[str, Any], operation_level: int):
+        hierarchy_filter = _hierarchy_filter(operation_level)
+        if query_params["filters"] is not None:
+            query_params["filters"] &= hierarchy_filter
+        else:
+            query_params["filters"] = hierarchy_filter
 
     def apply_parent_strategy(
         self,
@@ -239,7 +597,8 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
         If the resulting parent strategy is "replace", then only the parents are returned - in
         the same order as their children. Duplicate parents are removed. If the strategy is "include"
         the parents are added to the list of children, deduplicating the parents by having a parent
-        follow the child that comes first in order.
+        follow the child that comes first in order. A parent that was itself found by the query is
+        not added a second time.
 
         :param query_results: the list of objects returned from the query
         :param kwargs: additional keyword arguments that were passed to the search function
@@ -258,17 +617,14 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
             "parent strategy set to {parent_strategy}", parent_strategy=parent_strategy
         )
 
-        seen_parents = set()
         if parent_strategy == "replace":
             # return a deduplicated list of parents, retaining the order
-            parents = list()
-            for child in query_results:
-                if child.references is None:
-                    continue
-                for parent in child.references["parent"].objects:
-                    if parent.uuid not in seen_parents:
-                        parents.append(parent)
-                        seen_parents.add(parent.uuid)
+            parents = list(
+                {
+                    parent.uuid: parent
+                    for parent in _iterate_parents(query_results)
+                }.values()
+            )
             logger.debug(
                 "returning {nr_parents} parents from {nr_children} children",
                 nr_parents=len(parents),
@@ -277,20 +633,20 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
             return parents
 
         # return a combined list of children and their parents, making sure that
-        # parents are de-duplicated
-        combined = list()
+        # parents are de-duplicated; setdefault keeps the first occurrence in place
+        combined: dict[Any, Object] = dict()
         for child in query_results:
-            combined.append(child)
-            for parent in child.references["parent"]:
-                if parent.uuid not in seen_parents:
-                    combined.append(parent)
-                    seen_parents.add(parent.uuid)
+            combined.setdefault(child.uuid, child)
+            if child.references is None:
+                continue
+            for parent in child.references["parent"].objects:
+                combined.setdefault(parent.uuid, parent)
         logger.debug(
             "returning a combined total of {nr_objects} from {nr_children} children",
             nr_objects=len(combined),
             nr_children=len(query_results),
         )
-        return combined
+        return list(combined.values())
 
     @abstractmethod
     def _conduct_search(self, collection: Collection) -> Callable:
@@ -312,61 +668,188 @@ class AbstractSearcher(WeaviateClientProcessor, ABC):
         :return: a list of ChunkedDocuments containing the found chunks
         """
         query_params = self.create_query_params(**kwargs)
-        collection = self.get_collection_or_tenant(query_params)
+        return self._search_with_params(query_params)
+
+    def search_batch(self, queries: list[Any], **kwargs) -> list[list[ChunkedDocument]]:
+        """
+        Conduct a search for each of the given queries. The query parameters are created
+        once, and the searches are then dispatched concurrently. The results are returned
+        in the same order as the queries. Identical queries are only searched once, and
+        share the same list of results.
+
+        :param queries: the list of queries (text or vectors, depending on the searcher)
+        :param kwargs: the keyword arguments that will override any configured values
+        :return: a list containing, for each query, a list of ChunkedDocuments
+        """
+        _check_batch_size(queries)
+        if len(queries) == 0:
+            return []
+
+        # the query itself is left out, so it can be set per search
+        query_params = self.create_query_params(None, **kwargs)
         logger.info(
-            "conducting search on collection {collection_name}",
+            "conducting a batch of {nr_queries} searches",
+            nr_queries=len(queries),
+        )
+        unique_queries, positions = _deduplicate_queries(queries)
+        with ThreadPoolExecutor(
+            max_workers=min(len(unique_queries), MAX_BATCH_WORKERS)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._search_with_params,
+                    {**query_params, self.query_parameter: query},
+                )
+                for query in unique_queries
+            ]
+            results = [future.result() for future in futures]
+        return [results[position] for position in positions]
+
+    async def asearch(self, **kwargs) -> list[ChunkedDocument]:
+        """
+        The asynchronous counterpart of `search`. Uses the asynchronous Weaviate client, so
+        that many searches can be conducted concurrently from a single event loop.
+
+        :param kwargs: the keyword arguments that will override any configured values
+        :return: a list of ChunkedDocuments containing the found chunks
+        """
+        query_params = await self.acreate_query_params(**kwargs)
+        return await self._asearch_with_params(query_params)
+
+    async def _asearch_with_params(
+        self, query_params: dict[str, Any]
+    ) -> list[ChunkedDocument]:
+        collection = query_params["collection"]
+        logger.info(
+            "conducting async search on collection {collection_name}",
             collection_name=collection.name,
         )
+        search_function = self._conduct_search(collection)
+        arguments = self._bind_search_arguments(search_function, query_params)
+        try:
+            query_results = (await search_function(**arguments)).objects
+        except CONNECTION_ERRORS:
+            for client in self._evict_cached_collection(collection):
+                await self.async_client_factory.discard(client)
+            raise
+        return self._compile_results(query_results, query_params)
+
+    async def asearch_batch(
+        self, queries: list[Any], **kwargs
+    ) -> list[list[ChunkedDocument]]:
+        """
+        The asynchronous counterpart of `search_batch`. The searches are gathered on the
+        event loop and the results are returned in the same order as the queries.
 
-        # bind the necessary arguments to the values in query_params
+        :param queries: the list of queries (text or vectors, depending on the searcher)
+        :param kwargs: the keyword arguments that will override any configured values
+        :return: a list containing, for each query, a list of ChunkedDocuments
+        """
+        _check_batch_size(queries)
+        if len(queries) == 0:
+            return []
+
+        # the query itself is left out, so it can be set per search
+        query_params = await self.acreate_query_params(None, **kwargs)
+        logger.info(
+            "conducting a batch of {nr_queries} async searches",
+            nr_queries=len(queries),
+        )
+        unique_queries, positions = _deduplicate_queries(queries)
+        results = await asyncio.gather(
+            *[
+                self._asearch_with_params(
+                    {**query_params, self.query_parameter: query}
+                )
+                for query in unique_queries
+            ]
+        )
+        return [results[position] for position in positions]
+
+    def _search_with_params(self, query_params: dict[str, Any]) -> list[ChunkedDocument]:
+        collection = query_params["collection"]
+        logger.info(
+            "conducting search on collection {collection_name}",
+            collection_name=collection.name,
+        )
         search_function = self._conduct_search(collection)
-        function_signature = signature(search_function)
+        arguments = self._bind_search_arguments(search_function, query_params)
+        try:
+            query_results = search_function(**arguments).objects
+        except CONNECTION_ERRORS:
+            for client in self._evict_cached_collection(collection):
+                self.client_factory.discard(client)
+            raise
+        return self._compile_results(query_results, query_params)
+
+    @staticmethod
+    def _bind_search_arguments(
+        search_function: Callable,
+        query_params: dict[str, Any],
+    ) -> dict[str, Any]:
+        # bind the necessary arguments to the values in query_params
         function_params = {
-            k:query_params[k] if k in query_params else param.default
-            for k, param in function_signature.parameters.items()
+            k: query_params.get(k, default)
+            for k, default in _search_parameters(search_function)
         }
-        bound_function = function_signature.bind(**function_params)
-
-        # conduct the search and apply the parent strategy
         logger.debug(
             "using search function '{function_name}' with parameters {function_params}",
             function_name=search_function.__name__,
-            function_params=str(function_params),
+            function_params=function_params,
             **function_params,
         )
-        query_results = search_function(**bound_function.arguments).objects
-        query_results = self.apply_parent_strategy(query_results, **query_params)
+        return function_params
 
-        # compile the list of chunked documents and return it
+    def _compile_results(
+        self,
+        query_results: list[Object],
+        query_params: dict[str, Any],
+    ) -> list[ChunkedDocument]:
+        # apply the parent strategy, then compile the list of chunked documents
+        query_results = self.apply_parent_strategy(query_results, **query_params)
         return compile_chunked_documents(
             query_results, named_vector=query_params["target_vector"]
         )
 
 
 class SimilaritySearcher(AbstractSearcher):
+    query_parameter = "query"
 
     def create_query_params(self, query_text: str, **kwargs) -> dict[str, Any]:
         return super().create_query_params(query=query_text, **kwargs)
 
+    async def acreate_query_params(self, query_text: str, **kwargs) -> dict[str, Any]:
+        return await super().acreate_query_params(query=query_text, **kwargs)
+
     def _conduct_search(self, collection: Collection, **kwargs) -> Callable:
         return collection.query.near_text
 
 
 class VectorSimilaritySearcher(AbstractSearcher):
+    query_parameter = "near_vector"
 
     def create_query_params(
         self, query_embedding: list[float], **kwargs
     ) -> dict[str, Any]:
         return super().create_query_params(near_vector=query_embedding, **kwargs)
 
+    async def acreate_query_params(
+        self, query_embedding: list[float], **kwargs
+    ) -> dict[str, Any]:
+        return await super().acreate_query_params(near_vector=query_embedding, **kwargs)
+
     def _conduct_search(self, collection: Collection) -> Callable:
         return collection.query.near_vector
 
 
 class HybridSearcher(AbstractSearcher):
+    query_parameter = "query"
 
     def create_query_params(self, query_text: str, **kwargs) -> dict[str, Any]:
         return super().create_query_params(query=query_text, **kwargs)
 
+    async def acreate_query_params(self, query_text: str, **kwargs) -> dict[str, Any]:
+        return await super().acreate_query_params(query=query_text, **kwargs)
+
     def _conduct_search(self, collection: Collection) -> Callable:
         return collection.query.hybrid
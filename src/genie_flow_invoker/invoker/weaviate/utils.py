@@ -1,64 +1,68 @@
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 from loguru import logger
 
-from weaviate.collections.classes.filters import Filter, _Filters
+from weaviate.collections.classes.filters import Filter, _FilterByProperty, _Filters
 
 from genie_flow_invoker.invoker.weaviate.properties import create_flat_name
 
 
-def _create_attribute_filter(key: str, value: Any) -> _Filters | None:
-    if " " in key:
-        key_name, indicator = key.rsplit(" ", 1)
-    else:
-        key_name = key
-        indicator = "=="
+_FILTER_OPERATIONS: dict[str, Callable[[_FilterByProperty, Any], _Filters]] = {
+    "==": lambda by_property, value: by_property.equal(value),
+    "!=": lambda by_property, value: by_property.not_equal(value),
+    "~": lambda by_property, value: by_property.like(value),
+    "<": lambda by_property, value: by_property.less_than(value),
+    "<=": lambda by_property, value: by_property.less_or_equal(value),
+    ">": lambda by_property, value: by_property.greater_than(value),
+    ">=": lambda by_property, value: by_property.greater_or_equal(value),
+    "contains": lambda by_property, value: by_property.contains_any(value),
+    "in": lambda by_property, value: Filter.any_of(
+        [by_property.equal(v) for v in value]
+    ),
+    "not-in": lambda by_property, value: Filter.all_of(
+        [by_property.not_equal(v) for v in value]
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_filter_key(
+    key: str,
+) -> tuple[str, Callable[[_FilterByProperty, Any], _Filters]]:
+    """
+    Parse a filter key into the flat name of the property and the operation that is
+    indicated. Filter keys mostly come from invoker configuration, so the same keys are
+    parsed over and over again; hence the result is cached.
+
+    :param key: the filter key, a property path optionally followed by an indicator
+    :return: a tuple of the flat property name and the filter operation to apply
+    """
+    key_name, _, indicator = key.rpartition(" ")
+    if not key_name:
+        key_name, indicator = indicator, "=="
     logger.debug(
-        "found indicator {indicator} for property {property} for value {value}",
+        "found indicator {indicator} for property {property}",
         indicator=indicator,
         property=key_name,
-        value=value,
     )
-    flat_key = create_flat_name(key_name.strip())
-    filter_by_property = Filter.by_property(flat_key)
-    match indicator.strip():
-        case "==":
-            return filter_by_property.equal(value)
-        case "!=":
-            return filter_by_property.not_equal(value)
-        case "<":
-            return filter_by_property.less_than(value)
-        case "<=":
-            return filter_by_property.less_or_equal(value)
-        case ">":
-            return filter_by_property.greater_than(value)
-        case ">=":
-            return filter_by_property.greater_or_equal(value)
-        case "contains":
-            return filter_by_property.contains_any(value)
-        case "in":
-            return Filter.any_of(
-                [
-                    filter_by_property.equal(v)
-                    for v in value
-                ]
-            )
-        case "not-in":
-            return Filter.all_of(
-                [
-                    filter_by_property.not_equal(v)
-                    for v in value
-                ]
-            )
-        case _:
-            logger.error(
-                "Invalid indicator '{indicator}' for property {property}",
-                indicator=indicator,
-                property=key_name,
-            )
-            raise ValueError(
-                f"Got filter indicator '{indicator}' that is not supported"
-            )
+    try:
+        operation = _FILTER_OPERATIONS[indicator.strip()]
+    except KeyError:
+        logger.error(
+            "Invalid indicator '{indicator}' for property {property}",
+            indicator=indicator,
+            property=key_name,
+        )
+        raise ValueError(
+            f"Got filter indicator '{indicator}' that is not supported"
+        )
+    return create_flat_name(key_name.strip()), operation
+
+
+def _create_attribute_filter(key: str, value: Any) -> _Filters | None:
+    flat_key, operation = _parse_filter_key(key)
+    return operation(Filter.by_property(flat_key), value)
 
 
 def compile_filter(query_params: dict) -> Optional[Filter]:
@@ -1,10 +1,12 @@
 import uuid as uuidlib
 from collections import namedtuple
+from functools import cached_property
 from typing import Optional, Any
 
 from weaviate.collections.classes.aggregate import AggregateInteger, AggregateReturn
 from weaviate.collections.classes.internal import Object
 from weaviate.collections.classes.batch import DeleteManyReturn
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.filters import _FilterAnd, _Operator, _FilterOr, Filter, \
     _FilterByProperty, _Filters, _FilterValue
 from pytest import fixture
@@ -14,6 +16,8 @@ from genie_flow_invoker.doc_proc import ChunkedDocument, DocumentChunk
 from genie_flow_invoker.invoker.weaviate.properties import create_flat_name
 
 SearchResults = namedtuple("SearchResults", ["objects"])
+InsertResults = namedtuple("InsertResults", ["errors"])
+FailedObject = namedtuple("FailedObject", ["object_", "message"])
 
 
 class Recorder:
@@ -42,8 +46,13 @@ class MockQuery:
     def __init__(self, query_results: list[Object]):
         self.query_results = query_results
 
-    def fetch_objects(self):
-        return self.query_results
+    def fetch_objects(self, filters=None, limit=None, **kwargs):
+        results = [
+            result
+            for result in self.query_results
+            if filters is None or self._mock_filter(result, filters)
+        ]
+        return SearchResults(results[:limit])
 
     def near_text(self, **kwargs):
         return SearchResults(self.query_results)
@@ -66,6 +75,10 @@ class MockQuery:
             return any(
                 [self._mock_filter(o, child) for child in filters.filters],
             )
+        if isinstance(filters, _FilterValue) and filters.target == "_id":
+            if filters.operator == _Operator.CONTAINS_ANY:
+                return str(o.uuid) in filters.value
+            return str(o.uuid) == filters.value
         if isinstance(filters, _FilterValue):
             if filters.target not in o.properties:
                 return False
@@ -102,6 +115,30 @@ class MockCollectionData:
     def __init__(self, collection_name: str, query_results: list[Object]):
         self.collection_name = collection_name
         self.query_results = query_results
+        # the uuids of the objects that a batch insert fails to insert
+        self.failing_uuids: set[uuidlib.UUID] = set()
+
+    @staticmethod
+    def _as_uuid(uuid: str | uuidlib.UUID) -> uuidlib.UUID:
+        return uuidlib.UUID(uuid) if isinstance(uuid, str) else uuid
+
+    def _create_object(
+        self,
+        uuid: uuidlib.UUID,
+        properties: dict[str, Any],
+        references: dict[str, Any],
+        vector: list[float],
+    ) -> Object:
+        return Object(
+            collection=self.collection_name,
+            uuid=uuid,
+            properties=properties,
+            references=references,
+            vector={
+                "default": vector,
+            },
+            metadata={},
+        )
 
     def insert(
         self,
@@ -110,22 +147,25 @@ class MockCollectionData:
         references: dict[str, Any],
         vector: list[float],
     ):
-        if isinstance(uuid, str):
-            uuid = uuidlib.UUID(uuid)
+        uuid = self._as_uuid(uuid)
         self.query_results.append(
-            Object(
-                collection=self.collection_name,
-                uuid=uuid,
-                properties=properties,
-                references=references,
-                vector={
-                    "default": vector,
-                },
-                metadata={},
-            )
+            self._create_object(uuid, properties, references, vector)
         )
 
     def insert_many(self, data_objects: list):
+        errors = {
+            index: FailedObject(data_object, "mock failure")
+            for index, data_object in enumerate(data_objects)
+            if self._as_uuid(data_object.uuid) in self.failing_uuids
+        }
+        data_objects = [
+            data_object
+            for index, data_object in enumerate(data_objects)
+            if index not in errors
+        ]
+        # like Weaviate, a batch insert overwrites objects with the same uuid
+        uuids = {self._as_uuid(data_object.uuid) for data_object in data_objects}
+        self.query_results[:] = [d for d in self.query_results if d.uuid not in uuids]
         for data_object in data_objects:
             # Extract the vector from the dict format used by DataObject
             vector = None
@@ -138,6 +178,7 @@ class MockCollectionData:
                 references=data_object.references,
                 vector=vector,
             )
+        return InsertResults(errors)
 
     def replace(
         self,
@@ -146,14 +187,17 @@ class MockCollectionData:
         references: dict[str, Any],
         vector: list[float],
     ):
-        if type(uuid) is str:
-            uuid = uuidlib.UUID(uuid)
-        self.query_results = [d for d in self.query_results if d.uuid != uuid]
+        uuid = self._as_uuid(uuid)
+        for index, mine in enumerate(self.query_results):
+            if mine.uuid == uuid:
+                self.query_results[index] = self._create_object(
+                    uuid, properties, references, vector
+                )
+                return
         self.insert(uuid, properties, references, vector)
 
     def exists(self, uuid: str | uuidlib.UUID) -> bool:
-        if type(uuid) is str:
-            uuid = uuidlib.UUID(uuid)
+        uuid = self._as_uuid(uuid)
         for mine in self.query_results:
             if mine.uuid == uuid:
                 return True
@@ -168,6 +212,36 @@ class MockCollectionData:
         )
 
 
+class MockBatch:
+
+    def __init__(self, collection_data: "MockCollectionData"):
+        self.collection_data = collection_data
+        self.batch_size = None
+        self.data_objects = []
+        self.failed_objects = []
+
+    def fixed_size(self, batch_size: int = 100, concurrent_requests: int = 2):
+        self.batch_size = batch_size
+        self.failed_objects = []
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        results = self.collection_data.insert_many(self.data_objects)
+        self.failed_objects.extend(results.errors.values())
+        self.data_objects = []
+
+    def add_object(self, properties=None, references=None, uuid=None, vector=None):
+        self.data_objects.append(
+            DataObject(
+                properties=properties, references=references, uuid=uuid, vector=vector
+            )
+        )
+        return uuid
+
+
 class MockCollection:
 
     def __init__(
@@ -175,23 +249,32 @@ class MockCollection:
     ):
         self.name = collection_name
         self.query_results = query_results if query_results else []
+        # the accessors share query_results by reference, so they are built only once
+        self._query = MockQuery(self.query_results)
+        self._data = MockCollectionData(self.name, self.query_results)
+        self._aggregate = MockAggregate(self.query_results)
+        self._batch = MockBatch(self._data)
 
     @property
     def query(self):
-        return MockQuery(self.query_results)
+        return self._query
 
-    @property
+    @cached_property
     def tenants(self):
         tenant_name = f"Tenant{self.name}"
         return MockCollections({tenant_name: self.query_results})
 
     @property
     def data(self):
-        return MockCollectionData(self.name, self.query_results)
+        return self._data
+
+    @property
+    def batch(self):
+        return self._batch
 
     @property
     def aggregate(self):
-        return MockAggregate(self.query_results)
+        return self._aggregate
 
     @property
     def config(self):
@@ -234,12 +317,18 @@ class MockCollections:
             for collection_name, collection_results in collections_results.items()
         }
 
-    def get(self, collection_name: str):
+    def get(self, collection_name: Optional[str] = None):
+        if collection_name is None:
+            return self.collections
         return self.collections[collection_name]
 
     def exists(self, some_name: str):
         return True
 
+    def create(self, names: list[str]):
+        for name in names:
+            self.collections[name] = MockCollection(name)
+
     def remove(self, _: list[str]): ...
 
     def delete(self, _: str): ...
@@ -255,13 +344,136 @@ class MockWeaviateClientFactory:
 
     def __init__(self, collections_results: dict):
         self.collections_results = collections_results
+        self.batch_size = 1000
+        self._client = None
 
     def __enter__(self):
-        return MockWeaviateClient(self.collections_results)
+        if self._client is None:
+            self._client = MockWeaviateClient(self.collections_results)
+        return self._client
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
+    def hands_out(self, client):
+        return client is self._client
+
+    def discard(self, client):
+        if client is self._client:
+            self._client = None
+
+
+class MockAsyncQuery:
+
+    def __init__(self, query: MockQuery):
+        self._query = query
+
+    async def fetch_objects(self, **kwargs):
+        return self._query.fetch_objects(**kwargs)
+
+    async def near_text(self, **kwargs):
+        return self._query.near_text(**kwargs)
+
+    async def near_vector(self, near_vector, filters):
+        return self._query.near_vector(near_vector, filters)
+
+
+class MockAsyncAggregate:
+
+    def __init__(self, aggregate: MockAggregate):
+        self._aggregate = aggregate
+
+    async def over_all(self, **kwargs):
+        return self._aggregate.over_all(**kwargs)
+
+
+class MockAsyncCollectionData:
+
+    def __init__(self, data: MockCollectionData):
+        self._data = data
+
+    @property
+    def failing_uuids(self):
+        return self._data.failing_uuids
+
+    async def insert_many(self, data_objects: list):
+        return self._data.insert_many(data_objects)
+
+
+class MockAsyncTenants:
+
+    async def exists(self, tenant_name: str):
+        return True
+
+
+class MockAsyncCollection:
+
+    def __init__(self, collection: MockCollection):
+        self._collection = collection
+
+    @property
+    def name(self):
+        return self._collection.name
+
+    @property
+    def query(self):
+        return MockAsyncQuery(self._collection.query)
+
+    @property
+    def data(self):
+        return MockAsyncCollectionData(self._collection.data)
+
+    @property
+    def aggregate(self):
+        return MockAsyncAggregate(self._collection.aggregate)
+
+    @property
+    def tenants(self):
+        return MockAsyncTenants()
+
+    def with_tenant(self, tenant_name):
+        return MockAsyncCollection(self._collection.with_tenant(tenant_name))
+
+
+class MockAsyncCollections:
+
+    def __init__(self, collections: MockCollections):
+        self._collections = collections
+
+    def get(self, collection_name: str):
+        return MockAsyncCollection(self._collections.get(collection_name))
+
+    async def exists(self, collection_name: str):
+        return True
+
+
+class MockAsyncWeaviateClient:
+
+    def __init__(self, collections_results: dict):
+        self.collections = MockAsyncCollections(MockCollections(collections_results))
+
+
+class MockAsyncWeaviateClientFactory:
+
+    def __init__(self, collections_results: dict):
+        self.collections_results = collections_results
+        self._client = None
+
+    async def __aenter__(self):
+        if self._client is None:
+            self._client = MockAsyncWeaviateClient(self.collections_results)
+        return self._client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def hands_out(self, client):
+        return client is self._client
+
+    async def discard(self, client):
+        if client is self._client:
+            self._client = None
+
 
 @fixture
 def collections_results():
@@ -323,6 +535,16 @@ def weaviate_client_factory(collections_results):
     return MockWeaviateClientFactory(collections_results)
 
 
+@fixture
+def async_weaviate_client_factory(collections_results):
+    return MockAsyncWeaviateClientFactory(collections_results)
+
+
+@fixture
+def async_weaviate_client(collections_results):
+    return MockAsyncWeaviateClient(collections_results)
+
+
 @fixture
 def chunked_document():
     parent = DocumentChunk(
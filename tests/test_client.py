@@ -0,0 +1,128 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import weaviate
+from weaviate.exceptions import WeaviateConnectionError
+
+from genie_flow_invoker.invoker.weaviate import WeaviateClientFactory
+
+
+class FakeWeaviateClient:
+
+    def __init__(self, **kwargs):
+        self.connection_params = kwargs
+        self.nr_live_checks = 0
+        self.closed = False
+
+    def is_live(self):
+        self.nr_live_checks += 1
+        return True
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+CONNECTION_CONFIG = {
+    "http_host": "localhost",
+    "http_port": 8080,
+    "http_secure": False,
+    "grpc_host": "localhost",
+    "grpc_port": 50051,
+    "grpc_secure": False,
+}
+
+
+def test_client_reused_within_thread(monkeypatch):
+    monkeypatch.setattr(weaviate, "connect_to_custom", FakeWeaviateClient)
+    factory = WeaviateClientFactory(CONNECTION_CONFIG)
+
+    with factory as first_client:
+        pass
+    with factory as second_client:
+        pass
+    assert first_client is second_client
+    assert first_client.nr_live_checks == 0
+
+
+def test_client_replaced_when_not_connected(monkeypatch):
+    monkeypatch.setattr(weaviate, "connect_to_custom", FakeWeaviateClient)
+    factory = WeaviateClientFactory(CONNECTION_CONFIG)
+
+    with factory as first_client:
+        pass
+    first_client.close()
+    with factory as second_client:
+        pass
+    assert first_client is not second_client
+
+
+def test_client_discarded_on_connection_error(monkeypatch):
+    monkeypatch.setattr(weaviate, "connect_to_custom", FakeWeaviateClient)
+    factory = WeaviateClientFactory(CONNECTION_CONFIG)
+
+    with pytest.raises(WeaviateConnectionError):
+        with factory as first_client:
+            raise WeaviateConnectionError("connection lost")
+    with factory as second_client:
+        pass
+    assert first_client is not second_client
+    assert first_client.closed
+
+
+def test_client_pool_over_threads(monkeypatch):
+    monkeypatch.setattr(weaviate, "connect_to_custom", FakeWeaviateClient)
+    factory = WeaviateClientFactory(dict(pool_size=2, **CONNECTION_CONFIG))
+
+    # keep all threads inside the factory at the same time, so each uses its own thread
+    barrier = threading.Barrier(4, timeout=5)
+
+    def get_client(_):
+        with factory as client:
+            barrier.wait()
+            return client
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(get_client, range(4)))
+    assert len({id(client) for client in clients}) == 2
+
+    factory.close()
+    assert all(client.closed for client in clients)
+
+
+def test_client_batch_size(monkeypatch):
+    factory = WeaviateClientFactory(CONNECTION_CONFIG)
+    assert factory.batch_size == 1000
+
+    monkeypatch.setenv("WEAVIATE_BATCH_SIZE", "250")
+    factory = WeaviateClientFactory(CONNECTION_CONFIG)
+    assert factory.batch_size == 250
+
+    monkeypatch.setenv("WEAVIATE_BATCH_SIZE", "0")
+    with pytest.raises(ValueError):
+        WeaviateClientFactory(CONNECTION_CONFIG)
+
+
+def test_client_timeouts(monkeypatch):
+    monkeypatch.setattr(weaviate, "connect_to_custom", FakeWeaviateClient)
+    factory = WeaviateClientFactory(dict(timeout_query=5, **CONNECTION_CONFIG))
+
+    with factory as client:
+        timeout = client.connection_params["additional_config"].timeout
+    assert timeout.query == 5
+    assert timeout.init == 2
+    assert timeout.insert == 90
+
+
+def test_client_session_pool(monkeypatch):
+    monkeypatch.setattr(weaviate, "connect_to_custom", FakeWeaviateClient)
+    monkeypatch.setenv("WEAVIATE_SESSION_POOL_MAXSIZE", "50")
+    factory = WeaviateClientFactory(CONNECTION_CONFIG)
+
+    with factory as client:
+        connection = client.connection_params["additional_config"].connection
+    assert connection.session_pool_connections == 20
+    assert connection.session_pool_maxsize == 50
@@ -1,5 +1,7 @@
+import pytest
+
 from genie_flow_invoker.invoker.weaviate.properties import create_flat_name
-from genie_flow_invoker.invoker.weaviate.utils import compile_filter
+from genie_flow_invoker.invoker.weaviate.utils import _parse_filter_key, compile_filter
 from weaviate.collections.classes.filters import (
     Filter,
     _FilterAnd,
@@ -14,72 +16,44 @@ def test_filter_none():
     assert weaviate_fiter is None
 
 
-def test_filter_all():
-    filter_definition = {
-        "having_all": {
-            "equal_attr": 12,
-            "equal_attr2 ==": 12,
-            "not_equal_attr !=": 0,
-            "less_attr <": "zeus",
-            "less_equal_attr <=": "zeus",
-            "greater_attr >": "apollo",
-            "greater_equal_attr >=": "apollo",
-            "in_attr contains": "Dionysus",
-        }
-    }
-    weaviate_filter = compile_filter(filter_definition)
-
-    assert weaviate_filter is not None
-    assert isinstance(weaviate_filter, _FilterAnd)
-    assert len(weaviate_filter.filters) == 8
-    filters = [
-        [getattr(f, p) for p in ["operator", "target", "value"]]
-        for f in weaviate_filter.filters
-    ]
-    assert filters == [
-        [_Operator.EQUAL, create_flat_name("equal_attr"), 12],
-        [_Operator.EQUAL, create_flat_name("equal_attr2"), 12],
-        [_Operator.NOT_EQUAL, create_flat_name("not_equal_attr"), 0],
-        [_Operator.LESS_THAN, create_flat_name("less_attr"), "zeus"],
-        [_Operator.LESS_THAN_EQUAL, create_flat_name("less_equal_attr"), "zeus"],
-        [_Operator.GREATER_THAN, create_flat_name("greater_attr"), "apollo"],
-        [_Operator.GREATER_THAN_EQUAL, create_flat_name("greater_equal_attr"), "apollo"],
-        [_Operator.CONTAINS_ANY, create_flat_name("in_attr"), "Dionysus"],
-    ]
-
-
-def test_filter_any():
-    filter_definition = {
-        "having_any": {
-            "equal_attr": 12,
-            "equal_attr2 ==": 12,
-            "not_equal_attr !=": 0,
-            "less_attr <": "zeus",
-            "less_equal_attr <=": "zeus",
-            "greater_attr >": "apollo",
-            "greater_equal_attr >=": "apollo",
-            "in_attr contains": "Dionysus",
-        }
-    }
-    weaviate_filter = compile_filter(filter_definition)
+ATTRIBUTE_FILTERS = {
+    "equal_attr": 12,
+    "equal_attr2 ==": 12,
+    "not_equal_attr !=": 0,
+    "less_attr <": "zeus",
+    "less_equal_attr <=": "zeus",
+    "greater_attr >": "apollo",
+    "greater_equal_attr >=": "apollo",
+    "in_attr contains": "Dionysus",
+}
+
+EXPECTED_ATTRIBUTE_FILTERS = [
+    [_Operator.EQUAL, create_flat_name("equal_attr"), 12],
+    [_Operator.EQUAL, create_flat_name("equal_attr2"), 12],
+    [_Operator.NOT_EQUAL, create_flat_name("not_equal_attr"), 0],
+    [_Operator.LESS_THAN, create_flat_name("less_attr"), "zeus"],
+    [_Operator.LESS_THAN_EQUAL, create_flat_name("less_equal_attr"), "zeus"],
+    [_Operator.GREATER_THAN, create_flat_name("greater_attr"), "apollo"],
+    [_Operator.GREATER_THAN_EQUAL, create_flat_name("greater_equal_attr"), "apollo"],
+    [_Operator.CONTAINS_ANY, create_flat_name("in_attr"), "Dionysus"],
+]
+
+
+@pytest.mark.parametrize(
+    "having, filter_class",
+    [("having_all", _FilterAnd), ("having_any", _FilterOr)],
+)
+def test_filter_all_or_any(having, filter_class):
+    weaviate_filter = compile_filter({having: ATTRIBUTE_FILTERS})
 
     assert weaviate_filter is not None
-    assert isinstance(weaviate_filter, _FilterOr)
+    assert isinstance(weaviate_filter, filter_class)
     assert len(weaviate_filter.filters) == 8
     filters = [
         [getattr(f, p) for p in ["operator", "target", "value"]]
         for f in weaviate_filter.filters
     ]
-    assert filters == [
-        [_Operator.EQUAL, create_flat_name("equal_attr"), 12],
-        [_Operator.EQUAL, create_flat_name("equal_attr2"), 12],
-        [_Operator.NOT_EQUAL, create_flat_name("not_equal_attr"), 0],
-        [_Operator.LESS_THAN, create_flat_name("less_attr"), "zeus"],
-        [_Operator.LESS_THAN_EQUAL, create_flat_name("less_equal_attr"), "zeus"],
-        [_Operator.GREATER_THAN, create_flat_name("greater_attr"), "apollo"],
-        [_Operator.GREATER_THAN_EQUAL, create_flat_name("greater_equal_attr"), "apollo"],
-        [_Operator.CONTAINS_ANY, create_flat_name("in_attr"), "Dionysus"],
-    ]
+    assert filters == EXPECTED_ATTRIBUTE_FILTERS
 
 
 def test_filter_all_any():
@@ -173,4 +147,30 @@ def test_filter_not_in():
     for f in weaviate_filter.filters:
         assert isinstance(f, _FilterValue)
         assert f.operator == _Operator.NOT_EQUAL
-        assert f.value in {16, 32}
\ No newline at end of file
+        assert f.value in {16, 32}
+
+def test_filter_like():
+    filter_definition = {"having_all": {"name ~": "Zeus*"}}
+    weaviate_filter = compile_filter(filter_definition)
+
+    assert isinstance(weaviate_filter, _FilterValue)
+    assert weaviate_filter.target == create_flat_name("name")
+    assert weaviate_filter.operator == _Operator.LIKE
+    assert weaviate_filter.value == "Zeus*"
+
+
+def test_filter_invalid_indicator():
+    filter_definition = {"having_all": {"property <>": 12}}
+    with pytest.raises(ValueError):
+        compile_filter(filter_definition)
+
+
+def test_filter_key_parsed_once():
+    filter_definition = {"having_all": {"parsed_once_attr >=": 12}}
+    compile_filter(filter_definition)
+    hits = _parse_filter_key.cache_info().hits
+    weaviate_filter = compile_filter(filter_definition)
+
+    assert _parse_filter_key.cache_info().hits == hits + 1
+    assert weaviate_filter.operator == _Operator.GREATER_THAN_EQUAL
+    assert weaviate_filter.target == create_flat_name("parsed_once_attr")
@@ -1,3 +1,8 @@
+import asyncio
+import uuid
+
+import pytest
+from genie_flow_invoker.invoker.weaviate import persist
 from genie_flow_invoker.invoker.weaviate import WeaviatePersistor
 
 
@@ -18,6 +23,10 @@ def test_persist_same(weaviate_client_factory, chunked_document):
     assert nr_inserts == 0
     assert nr_replaces == 2
 
+    with weaviate_client_factory as client:
+        collection = client.collections.get("SimpleCollection")
+    assert len(collection.query.fetch_objects().objects) == 2
+
 
 def test_persist_other(weaviate_client_factory, other_chunked_document):
     params = {
@@ -37,4 +46,163 @@ def test_persist_other(weaviate_client_factory, other_chunked_document):
 
     with weaviate_client_factory as client:
         collection = client.collections.get("SimpleCollection")
-    assert len(collection.query.fetch_objects()) == 4
+    assert len(collection.query.fetch_objects().objects) == 4
+
+
+def test_persist_failed_objects(weaviate_client_factory, chunked_document):
+    persistor = WeaviatePersistor(weaviate_client_factory, {})
+
+    with weaviate_client_factory as client:
+        collection = client.collections.get("SimpleCollection")
+    collection.data.failing_uuids.add(uuid.UUID(chunked_document.chunks[1].chunk_id))
+
+    _, _, nr_inserts, nr_replaces = persistor.persist_document(
+        chunked_document,
+        "SimpleCollection",
+        None,
+    )
+    assert nr_inserts == 0
+    assert nr_replaces == 1
+
+
+def test_persist_existence_check_in_slices(
+    weaviate_client_factory, chunked_document, monkeypatch
+):
+    monkeypatch.setattr(persist, "MAX_EXISTENCE_CHECK_SIZE", 1)
+    persistor = WeaviatePersistor(weaviate_client_factory, {})
+
+    _, _, nr_inserts, nr_replaces = persistor.persist_document(
+        chunked_document,
+        "SimpleCollection",
+        None,
+    )
+    assert nr_inserts == 0
+    assert nr_replaces == 2
+
+
+def test_apersist_other(
+    weaviate_client_factory, async_weaviate_client_factory, other_chunked_document
+):
+    persistor = WeaviatePersistor(
+        weaviate_client_factory,
+        {"max_concurrency": "2", "batch_size": "1"},
+        async_weaviate_client_factory,
+    )
+
+    collection_name, tenant_name, nr_inserts, nr_replaces = asyncio.run(
+        persistor.apersist_document(
+            other_chunked_document,
+            "SimpleCollection",
+            None,
+        )
+    )
+    assert collection_name == "SimpleCollection"
+    assert nr_inserts == 2
+    assert nr_replaces == 0
+
+    with weaviate_client_factory as client:
+        collection = client.collections.get("SimpleCollection")
+    assert len(collection.query.fetch_objects().objects) == 4
+
+
+def test_apersist_failed_objects(
+    weaviate_client_factory, async_weaviate_client_factory, other_chunked_document
+):
+    persistor = WeaviatePersistor(
+        weaviate_client_factory, {}, async_weaviate_client_factory
+    )
+
+    async def persist_with_failure():
+        async with async_weaviate_client_factory as client:
+            collection = client.collections.get("SimpleCollection")
+        collection.data.failing_uuids.add(
+            uuid.UUID(other_chunked_document.chunks[0].chunk_id)
+        )
+        return await persistor.apersist_document(
+            other_chunked_document,
+            "SimpleCollection",
+            None,
+        )
+
+    _, _, nr_inserts, nr_replaces = asyncio.run(persist_with_failure())
+    assert nr_inserts == 1
+    assert nr_replaces == 0
+
+    with weaviate_client_factory as client:
+        collection = client.collections.get("SimpleCollection")
+    assert len(collection.query.fetch_objects().objects) == 3
+
+
+def test_persist_negative_batch_size(weaviate_client_factory, chunked_document):
+    with pytest.raises(ValueError):
+        WeaviatePersistor(weaviate_client_factory, {"batch_size": "-1"})
+
+    persistor = WeaviatePersistor(weaviate_client_factory, {})
+    with pytest.raises(ValueError):
+        persistor.persist_document(chunked_document, "SimpleCollection", batch_size=-1)
+
+
+def test_create_tenants_skips_existing(weaviate_client_factory, monkeypatch):
+    monkeypatch.setattr(persist, "MAX_TENANT_CREATE_SIZE", 1)
+    persistor = WeaviatePersistor(weaviate_client_factory, {})
+
+    with weaviate_client_factory as client:
+        collection = client.collections.get("SimpleCollection")
+    nr_creates = 0
+    create = collection.tenants.create
+
+    def counting_create(names):
+        nonlocal nr_creates
+        nr_creates += 1
+        return create(names)
+
+    monkeypatch.setattr(collection.tenants, "create", counting_create)
+    created = persistor.create_tenants(
+        collection,
+        ["TenantSimpleCollection", "NewTenant", "OtherTenant", "NewTenant"],
+    )
+    assert created == ["NewTenant", "OtherTenant"]
+    assert nr_creates == 2
+    assert {"NewTenant", "OtherTenant"} <= collection.tenants.get().keys()
+
+
+def test_compile_vector_index():
+    vector_index = persist._compile_vector_index({})
+    assert vector_index.vector_index_type().value == "flat"
+    assert vector_index.quantizer is None
+
+    vector_index = persist._compile_vector_index({"vector_index": "hnsw", "quantizer": "sq"})
+    assert vector_index.vector_index_type().value == "hnsw"
+    assert vector_index.quantizer is not None
+
+    with pytest.raises(ValueError):
+        persist._compile_vector_index({"vector_index": "annoy"})
+    with pytest.raises(ValueError):
+        persist._compile_vector_index({"quantizer": "sq"})
+
+
+def test_compile_named_vectors():
+    named_vectors = persist._compile_named_vectors({})
+    assert [named_vector.name for named_vector in named_vectors] == ["default"]
+
+    named_vectors = persist._compile_named_vectors(
+        {
+            "named_vectors": {
+                "title": {
+                    "vectorizer": "text2vec_huggingface",
+                    "source_properties": ["filename"],
+                },
+            },
+        }
+    )
+    assert [named_vector.name for named_vector in named_vectors] == ["default", "title"]
+    assert named_vectors[1].vectorizer.vectorizer.value == "text2vec-huggingface"
+
+    with pytest.raises(ValueError):
+        persist._compile_named_vectors({"named_vectors": {"title": {"vectorizer": "magic"}}})
+    with pytest.raises(ValueError):
+        persist._compile_named_vectors({"named_vectors": {"title": {}}})
+    with pytest.raises(ValueError, match="title"):
+        persist._compile_named_vectors(
+            {"named_vectors": {"title": {"vectorizer": "none", "vector_index_config": {}}}}
+        )
@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from conftest import MockQuery
 from genie_flow_invoker.invoker.weaviate import (
     WeaviatePersistInvoker,
@@ -24,3 +27,8 @@ def test_persist_invocation(weaviate_client_factory, chunked_document):
     assert response.tenant_name is None
     assert response.nr_inserts == 0
     assert response.nr_replaces == 2
+
+
+def test_persist_request_batch_size(chunked_document):
+    with pytest.raises(ValidationError):
+        WeaviatePersistenceRequest(document=chunked_document, batch_size=0)
@@ -1,6 +1,10 @@
+import asyncio
 import uuid
 
+import pytest
 from genie_flow_invoker.invoker.weaviate import SimilaritySearcher
+from genie_flow_invoker.invoker.weaviate.search import MAX_BATCH_SIZE
+from weaviate.exceptions import WeaviateConnectionError
 from weaviate.collections.classes.filters import (
     _FilterAnd,
     _FilterOr,
@@ -110,6 +114,48 @@ def test_similarity_query_params_tenant(weaviate_client_factory):
     assert query_params["method"] == "cosine"
 
 
+def test_similarity_query_params_cached_collection(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            tenant_name="TenantSimpleCollection",
+        ),
+    )
+    first_params = searcher.create_query_params("my query")
+    second_params = searcher.create_query_params("my other query")
+    assert first_params["collection"] is second_params["collection"]
+
+    weaviate_client_factory._client = None
+    third_params = searcher.create_query_params("my third query")
+    assert third_params["collection"] is not first_params["collection"]
+    assert len(searcher._collection_cache) == 1
+
+    searcher.refresh()
+    fourth_params = searcher.create_query_params("my fourth query")
+    assert fourth_params["collection"] is not third_params["collection"]
+
+
+def test_similarity_search_connection_error(weaviate_client_factory, monkeypatch):
+    def lose_connection(**kwargs):
+        raise WeaviateConnectionError("connection lost")
+
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    with weaviate_client_factory as client:
+        collection = client.collections.get("SimpleCollection")
+    monkeypatch.setattr(collection.query, "near_text", lose_connection)
+
+    with pytest.raises(WeaviateConnectionError):
+        searcher.search(query_text="my query")
+    assert not weaviate_client_factory.hands_out(client)
+    assert len(searcher._collection_cache) == 0
+
+
 def test_similarity_query_params_extra(weaviate_client_factory):
     searcher = SimilaritySearcher(
         weaviate_client_factory,
@@ -205,6 +251,52 @@ def test_similarity_query_params_has_all_and_any(weaviate_client_factory):
     assert type(query_params["filters"].filters[1]) == _FilterOr
 
 
+def test_similarity_query_params_filter_reused(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            having_all={"some_property": 42},
+        ),
+    )
+    first_params = searcher.create_query_params("my query")
+    second_params = searcher.create_query_params("my other query")
+    assert first_params["filters"] is second_params["filters"]
+
+    override_params = searcher.create_query_params(
+        "my query", having_all={"other_property": 24}
+    )
+    assert override_params["filters"] is not first_params["filters"]
+    assert override_params["filters"].value == 24
+
+
+def test_similarity_query_params_return_properties(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            return_properties=["document_metadata.language"],
+        ),
+    )
+    query_params = searcher.create_query_params("my query")
+    assert "content" in query_params["return_properties"]
+    assert "property_map" in query_params["return_properties"]
+    assert create_flat_name("document_metadata.language") in query_params["return_properties"]
+    assert create_flat_name("document_metadata.source") not in query_params["return_properties"]
+
+    query_params = searcher.create_query_params("my query", return_properties=[])
+    assert create_flat_name("document_metadata.language") not in query_params["return_properties"]
+
+    query_params = searcher.create_query_params(
+        "my query", return_properties="document_metadata.language"
+    )
+    assert create_flat_name("document_metadata.language") in query_params["return_properties"]
+    assert len(query_params["return_properties"]) == 7
+
+    with pytest.raises(ValueError):
+        searcher.create_query_params("my query", return_properties=42)
+
+
 def test_similarity_query_params_level(weaviate_client_factory):
     searcher = SimilaritySearcher(
         weaviate_client_factory,
@@ -220,6 +312,37 @@ def test_similarity_query_params_level(weaviate_client_factory):
     assert query_params["filters"].target == "hierarchy_level"
 
 
+def test_similarity_query_params_negative_level_cached(
+    weaviate_client_factory, monkeypatch
+):
+    with weaviate_client_factory as client:
+        aggregate = client.collections.get("SimpleCollection").aggregate
+    nr_aggregations = 0
+    over_all = aggregate.over_all
+
+    def counting_over_all(**kwargs):
+        nonlocal nr_aggregations
+        nr_aggregations += 1
+        return over_all(**kwargs)
+
+    monkeypatch.setattr(aggregate, "over_all", counting_over_all)
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            operation_level=-1,
+        ),
+    )
+    first_params = searcher.create_query_params("my query")
+    second_params = searcher.create_query_params("my other query")
+    assert nr_aggregations == 1
+    assert first_params["filters"].value == second_params["filters"].value == 1
+
+    searcher.refresh()
+    searcher.create_query_params("my query")
+    assert nr_aggregations == 2
+
+
 def test_similarity_search(weaviate_client_factory):
     searcher = SimilaritySearcher(
         weaviate_client_factory,
@@ -243,3 +366,129 @@ def test_similarity_search(weaviate_client_factory):
     assert chunk.hierarchy_level == 1
     assert chunk.parent_id == str(uuid.uuid3(uuid.NAMESPACE_OID, "second document"))
     assert chunk.embedding == [3.14] * 12
+
+
+def test_similarity_search_include_parents(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            parent_strategy="include",
+        ),
+    )
+    results = searcher.search(query_text="my query")
+    assert len(results) == 1
+    assert [chunk.content for chunk in results[0].chunks] == [
+        "Hello Parent",
+        "Hello World",
+    ]
+
+
+def test_similarity_search_batch(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            parent_strategy="replace",
+        ),
+    )
+    results = searcher.search_batch(["my query", "my other query", "a third query"])
+    assert len(results) == 3
+    for result in results:
+        assert len(result) == 1
+        assert len(result[0].chunks) == 1
+        assert result[0].chunks[0].content == "Hello Parent"
+
+
+def test_similarity_search_batch_duplicates(weaviate_client_factory, monkeypatch):
+    searched_queries = []
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    search_with_params = searcher._search_with_params
+
+    def recording_search_with_params(query_params):
+        searched_queries.append(query_params["query"])
+        return search_with_params(query_params)
+
+    monkeypatch.setattr(searcher, "_search_with_params", recording_search_with_params)
+    results = searcher.search_batch(["my query", "my other query", "my query"])
+    assert sorted(searched_queries) == ["my other query", "my query"]
+    assert len(results) == 3
+    assert results[0] is results[2]
+
+
+def test_similarity_search_batch_too_large(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    with pytest.raises(ValueError):
+        searcher.search_batch(["my query"] * (MAX_BATCH_SIZE + 1))
+
+
+def test_similarity_asearch(weaviate_client_factory, async_weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            operation_level=-1,
+        ),
+        async_weaviate_client_factory,
+    )
+    results = asyncio.run(searcher.asearch(query_text="my query"))
+    assert len(results) == 1
+    assert len(results[0].chunks) == 2
+
+
+def test_similarity_aquery_params_cached_collection(
+    weaviate_client_factory, async_weaviate_client_factory
+):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            tenant_name="TenantSimpleCollection",
+        ),
+        async_weaviate_client_factory,
+    )
+
+    first_params = asyncio.run(searcher.acreate_query_params("my query"))
+    second_params = asyncio.run(searcher.acreate_query_params("my other query"))
+    assert first_params["collection"] is second_params["collection"]
+
+    async_weaviate_client_factory._client = None
+    third_params = asyncio.run(searcher.acreate_query_params("my third query"))
+    assert third_params["collection"] is not first_params["collection"]
+
+
+def test_similarity_asearch_batch(weaviate_client_factory, async_weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            parent_strategy="replace",
+        ),
+        async_weaviate_client_factory,
+    )
+    results = asyncio.run(searcher.asearch_batch(["my query", "my other query"]))
+    assert len(results) == 2
+    for result in results:
+        assert len(result) == 1
+        assert result[0].chunks[0].content == "Hello Parent"
+
+
+def test_similarity_asearch_no_async_factory(weaviate_client_factory):
+    searcher = SimilaritySearcher(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    with pytest.raises(ValueError):
+        asyncio.run(searcher.asearch(query_text="my query"))
@@ -1,8 +1,16 @@
+import asyncio
+import gc
 import json
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+import weaviate
 from genie_flow_invoker.doc_proc import ChunkedDocument
 from genie_flow_invoker.invoker.weaviate import (
+    AsyncWeaviateClientFactory,
+    WeaviateBatchSimilaritySearchInvoker,
     WeaviateSimilaritySearchInvoker,
     WeaviateVectorSimilaritySearchInvoker,
     WeaviateSimilaritySearchRequest,
@@ -32,6 +40,156 @@ def test_search_invoke(weaviate_client_factory):
     assert chunk.content == "Hello World"
 
 
+def test_search_invoke_concurrently(weaviate_client_factory):
+    invoker = WeaviateSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+            operation_level=-1,
+            having_all={"document_metadata.language": "en"},
+        ),
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results_json = list(
+            executor.map(invoker.invoke, [f"query {i}" for i in range(32)])
+        )
+
+    assert len(set(results_json)) == 1
+    assert invoker.searcher.base_query_params["operation_level"] == -1
+    assert invoker.searcher.base_query_params["having_all"] == {
+        "document_metadata.language": "en"
+    }
+
+
+def test_vector_search_invoke(weaviate_client_factory):
+    invoker = WeaviateVectorSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    result_json = invoker.invoke(json.dumps([0.1, -0.1, 0.2]))
+    result = [ChunkedDocument.model_validate(r) for r in json.loads(result_json)]
+
+    assert len(result) == 1
+    assert len(result[0].chunks) == 2
+
+
+def test_vector_search_invoke_invalid(weaviate_client_factory):
+    invoker = WeaviateVectorSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    with pytest.raises(ValueError):
+        invoker.invoke(json.dumps({"query_embedding": [0.1, -0.1]}))
+    with pytest.raises(ValueError):
+        invoker.invoke("[0.1, -0.1")
+
+
+def test_search_ainvoke(weaviate_client_factory, async_weaviate_client_factory):
+    invoker = WeaviateSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+        async_weaviate_client_factory,
+    )
+    result_json = asyncio.run(invoker.ainvoke("who killed Bambi"))
+    result = [ChunkedDocument.model_validate(r) for r in json.loads(result_json)]
+
+    assert len(result) == 1
+    assert len(result[0].chunks) == 2
+
+
+def test_search_ainvoke_over_event_loops(
+    weaviate_client_factory, async_weaviate_client, monkeypatch
+):
+    class LoopBoundAsyncClient:
+        """An async client that, like the real one, only works on the loop it connected on"""
+
+        def __init__(self, **kwargs):
+            self.collections = async_weaviate_client.collections
+            self.loop = None
+
+        async def connect(self):
+            self.loop = asyncio.get_running_loop()
+
+        def is_connected(self):
+            return True
+
+        async def close(self): ...
+
+    client_refs = []
+
+    def use_async_with_custom(**kwargs):
+        client = LoopBoundAsyncClient(**kwargs)
+        client_refs.append(weakref.ref(client))
+        return client
+
+    monkeypatch.setattr(weaviate, "use_async_with_custom", use_async_with_custom)
+    invoker = WeaviateSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+        AsyncWeaviateClientFactory(
+            dict(
+                http_host="localhost",
+                http_port=8080,
+                http_secure=False,
+                grpc_host="localhost",
+                grpc_port=50051,
+                grpc_secure=False,
+            )
+        ),
+    )
+    first_json = asyncio.run(invoker.ainvoke("who killed Bambi"))
+    second_json = asyncio.run(invoker.ainvoke("who killed Bambi"))
+
+    assert first_json == second_json
+    assert len(client_refs) == 2
+
+    # the client of the closed event loop is released, also by the collection cache
+    gc.collect()
+    assert client_refs[0]() is None
+    assert client_refs[1]() is not None
+    assert len(invoker.searcher._collection_cache) == 1
+
+
+def test_batch_search_invoke(weaviate_client_factory):
+    invoker = WeaviateBatchSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    result_json = invoker.invoke(json.dumps(["who killed Bambi", "who saved Nemo"]))
+    result = [
+        [ChunkedDocument.model_validate(r) for r in query_result]
+        for query_result in json.loads(result_json)
+    ]
+
+    assert len(result) == 2
+    for query_result in result:
+        assert len(query_result) == 1
+        assert len(query_result[0].chunks) == 2
+
+
+def test_batch_search_invoke_invalid(weaviate_client_factory):
+    invoker = WeaviateBatchSimilaritySearchInvoker(
+        weaviate_client_factory,
+        dict(
+            collection_name="SimpleCollection",
+        ),
+    )
+    with pytest.raises(ValueError):
+        invoker.invoke(json.dumps(["who killed Bambi", 42]))
+    with pytest.raises(ValueError):
+        invoker.invoke("who killed Bambi")
+
+
 def test_request_search_invoke(weaviate_client_factory):
     invoker = WeaviateSimilaritySearchRequestInvoker(weaviate_client_factory, dict())
     search_request = WeaviateSimilaritySearchRequest(